@@ -0,0 +1,23 @@
+"""
+URL path converters for the meeting app.
+
+Requirements: 6.1, 6.3
+"""
+from urllib.parse import unquote
+
+
+class EmailConverter:
+    """
+    Match a single path segment shaped like an email address.
+    
+    Malformed values fail URL resolution with a 404 before the view runs,
+    so they never reach the database. Values are percent-decoded here so
+    views receive the plain address.
+    """
+    regex = r'[^/@\s]+@[^/@\s]+\.[^/@\s]+'
+    
+    def to_python(self, value):
+        return unquote(value)
+    
+    def to_url(self, value):
+        return value
@@ -0,0 +1,50 @@
+"""
+API exception handling for the meeting app.
+
+Requirements: 7.1, 7.5
+"""
+import logging
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler as drf_exception_handler, set_rollback
+
+logger = logging.getLogger(__name__)
+
+
+def exception_handler(exc, context):
+    """
+    Render unexpected errors with the API's generic 500 error body.
+    
+    DRF's handler still formats APIException, Http404 and PermissionDenied.
+    Anything it does not handle would otherwise propagate as a Django 500
+    page, so views can leave unexpected errors to this handler instead of
+    wrapping their whole body in a catch-all try/except. The traceback is
+    logged and, as DRF does for the errors it handles, an ATOMIC_REQUESTS
+    transaction is marked for rollback before the 500 is returned. With
+    DEBUG on, the exception is left to propagate so Django's debug page is
+    shown instead.
+    
+    Requirement: 7.5 - Consistent error responses
+    """
+    response = drf_exception_handler(exc, context)
+    if response is not None:
+        return response
+    
+    if settings.DEBUG:
+        return None
+    
+    view = context.get('view')
+    logger.exception(
+        'Unhandled error in %s', type(view).__name__ if view is not None else 'API view',
+        exc_info=exc
+    )
+    set_rollback()
+    return Response(
+        {
+            'error': 'Internal server error',
+            'details': 'An unexpected error occurred'
+        },
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meeting', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='meeting',
+            constraint=models.CheckConstraint(check=models.Q(('end_time__gt', models.F('start_time'))), name='meeting_end_after_start'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meeting', '0002_meeting_end_after_start'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='participant',
+            name='meeting_par_email_38e4e0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['start_time', 'end_time'], name='meeting_mee_start_t_6ebfbd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['email', 'meeting'], name='meeting_par_email_8f3063_idx'),
+        ),
+    ]
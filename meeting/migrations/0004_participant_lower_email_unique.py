@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:51
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meeting', '0003_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='participant',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='participant',
+            constraint=models.UniqueConstraint(models.F('meeting'), django.db.models.functions.text.Lower('email'), name='uniq_meeting_lower_email'),
+        ),
+    ]
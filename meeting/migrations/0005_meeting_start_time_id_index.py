@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('meeting', '0004_participant_lower_email_unique'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='meeting',
+            name='meeting_mee_start_t_b59151_idx',
+        ),
+        migrations.AddIndex(
+            model_name='meeting',
+            index=models.Index(fields=['start_time', 'id'], name='meeting_mee_start_t_23e5de_idx'),
+        ),
+    ]
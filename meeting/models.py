@@ -1,5 +1,7 @@
 import uuid
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Lower
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 
@@ -21,8 +23,22 @@ class Meeting(models.Model):
     class Meta:
         ordering = ['start_time']
         indexes = [
-            models.Index(fields=['start_time']),
+            # Keyset pagination orders by (start_time, id); the index also
+            # serves plain start_time filters and ordering
+            models.Index(fields=['start_time', 'id']),
             models.Index(fields=['end_time']),
+            # Composite index for the half-open interval overlap predicate
+            # (start_time < X AND end_time > Y) used by conflict detection
+            models.Index(fields=['start_time', 'end_time']),
+        ]
+        constraints = [
+            # Enforce the end-after-start invariant at the database level so
+            # bulk_create (which bypasses save) cannot insert invalid rows.
+            # Requirement: 1.2
+            models.CheckConstraint(
+                check=Q(end_time__gt=F('start_time')),
+                name='meeting_end_after_start'
+            ),
         ]
     
     def clean(self):
@@ -38,10 +54,28 @@ class Meeting(models.Model):
                 })
     
     def save(self, *args, **kwargs):
-        """Override save to call full_clean for validation."""
-        self.full_clean()
+        """
+        Override save to validate the time range before writing.
+        
+        Only clean() is run here rather than full_clean(), which keeps saves
+        cheap; the end-after-start invariant is also enforced by the
+        meeting_end_after_start database constraint, so
+        Meeting.objects.bulk_create(objs, batch_size=1000) is safe to use for
+        bulk imports even though it bypasses save().
+        """
+        self.clean()
         super().save(*args, **kwargs)
     
+    def touch(self):
+        """
+        Bump updated_at without re-running validation or rewriting other columns.
+        
+        Used when a change to the meeting's participants alters its exported
+        ICS, so the export's ETag and Last-Modified validators change too.
+        """
+        self.updated_at = timezone.now()
+        Meeting.objects.filter(pk=self.pk).update(updated_at=self.updated_at)
+    
     def __str__(self):
         return f"{self.title} ({self.start_time} - {self.end_time})"
 
@@ -63,11 +97,21 @@ class Participant(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     
     class Meta:
-        # Ensure unique participant per meeting (prevent duplicates)
+        # Ensure unique participant per meeting (prevent duplicates).
+        # Emails are compared case-insensitively, matching the lowercasing
+        # done by ParticipantSerializer.validate_email.
         # Requirement: 2.2
-        unique_together = [['meeting', 'email']]
+        constraints = [
+            models.UniqueConstraint(
+                F('meeting'),
+                Lower('email'),
+                name='uniq_meeting_lower_email',
+            ),
+        ]
         indexes = [
-            models.Index(fields=['email']),
+            # Composite index so participant-email lookups joining back to
+            # meetings can be answered from the index alone
+            models.Index(fields=['email', 'meeting']),
         ]
     
     def __str__(self):
@@ -0,0 +1,25 @@
+"""
+Pagination classes for the meeting app.
+
+Requirements: 5.4
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class MeetingCursorPagination(CursorPagination):
+    """
+    Opt-in cursor pagination for the meeting list, ordered by (start_time, id).
+    
+    DRF builds the cursor from the first ordering field only: each page
+    starts with a start_time range condition, served by the
+    (start_time, id) index, plus a small offset to skip meetings that share
+    the cursor's start_time. id only makes the order stable. Deep pages
+    therefore cost about the same as the first one, unlike OFFSET/LIMIT,
+    unless many meetings start at the same instant. Pagination only applies
+    when the client passes page_size; otherwise the list is returned
+    unpaginated as before.
+    """
+    ordering = ('start_time', 'id')
+    page_size = None
+    page_size_query_param = 'page_size'
+    max_page_size = 1000
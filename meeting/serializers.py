@@ -6,9 +6,18 @@ for Meeting and Participant models.
 
 Requirements: 1.3, 7.3
 """
+import re
+from django.db import models
 from rest_framework import serializers
+from rest_framework.fields import SkipField
 from .models import Meeting, Participant
 
+# Matches emails that are already lowercase ASCII, so lower() can be skipped
+_IS_LOWER_ASCII = re.compile(r'^[a-z0-9@._+\-]+$').match
+
+# Renders participant timestamps exactly as ParticipantSerializer would
+_render_datetime = serializers.DateTimeField().to_representation
+
 
 class ParticipantSerializer(serializers.ModelSerializer):
     """
@@ -32,7 +41,12 @@ class ParticipantSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Email address cannot be empty")
         
         # Django's EmailField already validates format, but we add extra checks
-        value = value.strip().lower()
+        value = value.strip()
+        
+        # Most emails arrive already lowercased; only allocate a new string
+        # when there is something to lowercase
+        if not _IS_LOWER_ASCII(value):
+            value = value.lower()
         
         return value
     
@@ -48,13 +62,48 @@ class ParticipantSerializer(serializers.ModelSerializer):
         return value.strip()
 
 
+class MeetingListSerializer(serializers.ListSerializer):
+    """
+    List serializer that resolves the child's readable fields once per list.
+    
+    The default ListSerializer calls child.to_representation() per row,
+    which re-walks the field mapping and re-resolves each field's bound
+    methods for every meeting. Here the (name, get_attribute,
+    to_representation) triples are collected once and reused for all rows.
+    Output is identical to the default implementation.
+    
+    Requirements: 5.4, 6.1
+    """
+    
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        
+        fields = [
+            (field.field_name, field.get_attribute, field.to_representation)
+            for field in self.child._readable_fields
+        ]
+        
+        rows = []
+        for instance in iterable:
+            row = {}
+            for name, get_attribute, to_representation in fields:
+                try:
+                    attribute = get_attribute(instance)
+                except SkipField:
+                    continue
+                row[name] = None if attribute is None else to_representation(attribute)
+            rows.append(row)
+        
+        return rows
+
+
 class MeetingSerializer(serializers.ModelSerializer):
     """
     Serializer for Meeting model with validation for required fields and time logic.
     
     Requirements: 1.3, 7.3
     """
-    participants = ParticipantSerializer(many=True, read_only=True)
+    participants = serializers.SerializerMethodField()
     
     class Meta:
         model = Meeting
@@ -69,6 +118,27 @@ class MeetingSerializer(serializers.ModelSerializer):
             'participants'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        list_serializer_class = MeetingListSerializer
+    
+    def get_participants(self, obj):
+        """
+        Render participants as plain dicts.
+        
+        Reads through obj.participants.all() so a prefetch_related on the
+        queryset is reused, and skips building a ParticipantSerializer per
+        participant since the nested data is read-only.
+        
+        Returns the same keys as ParticipantSerializer.
+        """
+        return [
+            {
+                'id': str(participant.id),
+                'email': participant.email,
+                'name': participant.name,
+                'created_at': _render_datetime(participant.created_at),
+            }
+            for participant in obj.participants.all()
+        ]
     
     def validate_title(self, value):
         """
@@ -90,34 +160,57 @@ class MeetingSerializer(serializers.ModelSerializer):
         - 1.3: Required field validation
         - 7.3: Detailed validation error messages
         """
-        # Check if we're updating and need to get existing values
-        if self.instance:
-            start_time = data.get('start_time', self.instance.start_time)
-            end_time = data.get('end_time', self.instance.end_time)
-        else:
+        errors = {}
+        
+        if self.instance is None:
             start_time = data.get('start_time')
             end_time = data.get('end_time')
-        
-        # Validate required fields for creation
-        if not self.instance:
+            
+            # Validate required fields for creation
             if not start_time:
-                raise serializers.ValidationError({
-                    'start_time': 'This field is required'
-                })
+                errors['start_time'] = 'This field is required'
             if not end_time:
-                raise serializers.ValidationError({
-                    'end_time': 'This field is required'
-                })
+                errors['end_time'] = 'This field is required'
             if 'title' not in data:
-                raise serializers.ValidationError({
-                    'title': 'This field is required'
-                })
+                errors['title'] = 'This field is required'
+        else:
+            # Updating: fall back to the stored values for omitted fields
+            start_time = data.get('start_time', self.instance.start_time)
+            end_time = data.get('end_time', self.instance.end_time)
         
         # Validate time logic
-        if start_time and end_time:
-            if end_time <= start_time:
-                raise serializers.ValidationError({
-                    'end_time': 'End time must be after start time'
-                })
+        if start_time and end_time and end_time <= start_time:
+            errors['end_time'] = 'End time must be after start time'
+        
+        # Report every problem at once instead of raising on the first one
+        if errors:
+            raise serializers.ValidationError(errors)
         
         return data
+
+
+class MeetingReadSerializer(MeetingSerializer):
+    """
+    Read-only variant of MeetingSerializer for GET endpoints.
+    
+    Every field is read-only, so DRF binds no writable-field validators when
+    the serializer is built; output matches MeetingSerializer exactly.
+    
+    Requirements: 5.4, 6.1
+    """
+    
+    class Meta(MeetingSerializer.Meta):
+        read_only_fields = MeetingSerializer.Meta.fields
+
+
+class BulkConflictCheckSerializer(serializers.Serializer):
+    """
+    Validate the meeting IDs posted to the bulk conflict check.
+    
+    Requirements: 3.4, 7.3
+    """
+    meeting_ids = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=500
+    )
@@ -6,12 +6,181 @@ business logic operations.
 
 Requirements: 3.1, 3.2, 3.4, 4.1, 4.2, 4.4, 4.5
 """
-from django.db.models import Q
+import heapq
+from collections import defaultdict
+from operator import attrgetter
+from django.db.models import Prefetch
 from django.utils import timezone as django_timezone
 from .models import Meeting, Participant
-from icalendar import Calendar, Event, vCalAddress, vText
 from datetime import datetime, timezone
 
+_UTC = timezone.utc
+
+# Meeting columns returned by conflict queries (enough for conflict reports)
+CONFLICT_FIELDS = ('id', 'title', 'description', 'start_time', 'end_time')
+_ICS_DATETIME_FORMAT = '%Y%m%dT%H%M%SZ'
+_ICS_CALENDAR_HEADER = (
+    b'BEGIN:VCALENDAR\r\n'
+    b'PRODID:-//Meeting Scheduler//Meeting Scheduler API//EN\r\n'
+    b'VERSION:2.0\r\n'
+    b'CALSCALE:GREGORIAN\r\n'
+    b'METHOD:PUBLISH\r\n'
+)
+_ICS_CALENDAR_FOOTER = b'END:VCALENDAR\r\n'
+# RFC 5545 TEXT escapes, applied by _escape_text in one str.translate pass
+_ICS_TEXT_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    ';': '\\;',
+    ',': '\\,',
+    '\n': '\\n',
+    '\r': None,
+})
+# Control characters other than HTAB are not allowed in parameter values or
+# calendar addresses; dropping them keeps a value from starting a new line
+_ICS_CONTROL_CHARS = dict.fromkeys([*range(0x09), *range(0x0A, 0x20), 0x7F])
+# RFC 6868 parameter value escapes, applied by _escape_param after line
+# breaks are normalized to LF
+_ICS_PARAM_ESCAPES = {
+    **_ICS_CONTROL_CHARS,
+    ord('^'): '^^',
+    ord('\n'): '^n',
+    ord('"'): "^'",
+}
+
+
+def _to_utc(dt):
+    """
+    Return a timezone-aware copy of dt in UTC.
+    
+    Naive datetimes are assumed to already be in UTC. Datetimes loaded from
+    the database with USE_TZ=True are already UTC and are returned as-is,
+    skipping the astimezone() allocation.
+    
+    Requirement: 4.5 - Proper timezone handling (UTC)
+    """
+    tzinfo = dt.tzinfo
+    if tzinfo is _UTC:
+        return dt
+    return dt.replace(tzinfo=_UTC) if tzinfo is None else dt.astimezone(_UTC)
+
+
+def _overlap_obj(meeting1, meeting2):
+    """
+    Overlap check for two Meeting-like objects: start_A < end_B AND start_B < end_A.
+    
+    Requirement: 3.2 - Time overlap detection logic
+    """
+    return meeting1.start_time < meeting2.end_time and meeting2.start_time < meeting1.end_time
+
+
+def _overlap_dict(meeting1, meeting2):
+    """
+    Overlap check for two dicts with start_time and end_time keys.
+    
+    Requirement: 3.2 - Time overlap detection logic
+    """
+    return meeting1['start_time'] < meeting2['end_time'] and meeting2['start_time'] < meeting1['end_time']
+
+
+def _time_range(meeting):
+    """Return (start_time, end_time) for a Meeting object or dict."""
+    if isinstance(meeting, dict):
+        return meeting['start_time'], meeting['end_time']
+    return meeting.start_time, meeting.end_time
+
+
+def _escape_text(value):
+    """
+    Escape a TEXT property value per RFC 5545 section 3.3.11.
+    
+    CR is dropped so CRLF and LF line breaks both become a literal \\n.
+    """
+    return value.translate(_ICS_TEXT_ESCAPES)
+
+
+def _escape_param(value):
+    """
+    Format a property parameter value per RFC 5545 section 3.2.
+    
+    Line breaks, '^' and DQUOTE are escaped per RFC 6868 (as ^n, ^^ and ^'),
+    matching icalendar, and other control characters are dropped, so a value
+    can never end the content line. Values containing ':', ';' or ',' must
+    be quoted.
+    """
+    value = value.replace('\r\n', '\n').replace('\r', '\n').translate(_ICS_PARAM_ESCAPES)
+    if ':' in value or ';' in value or ',' in value:
+        return f'"{value}"'
+    return value
+
+
+def _fold_line(line):
+    """
+    Fold a content line (bytes) into CRLF-terminated lines of at most 75 octets.
+    
+    Continuation lines start with a single space. Folds never split a
+    multi-byte UTF-8 sequence.
+    
+    Requirement: 4.5 - Follow RFC 5545 iCalendar format standards
+    """
+    if len(line) <= 75:
+        return line + b'\r\n'
+    
+    out = bytearray()
+    start = 0
+    limit = 75
+    length = len(line)
+    while length - start > limit:
+        end = start + limit
+        # Back off so we don't split a UTF-8 continuation byte
+        while line[end] & 0xC0 == 0x80:
+            end -= 1
+        out += line[start:end]
+        out += b'\r\n '
+        start = end
+        limit = 74
+    out += line[start:]
+    out += b'\r\n'
+    return bytes(out)
+
+
+def _event_head_bytes(meeting):
+    """
+    Render BEGIN:VEVENT and the meeting's own properties, without attendees.
+    
+    Requirements: 4.2, 4.5
+    """
+    lines = [
+        f'UID:{meeting.id}',
+        f'SUMMARY:{_escape_text(meeting.title)}',
+    ]
+    if meeting.description:
+        lines.append(f'DESCRIPTION:{_escape_text(meeting.description)}')
+    
+    # Requirement: 4.5 - Proper timezone handling (UTC)
+    created_at = _to_utc(meeting.created_at).strftime(_ICS_DATETIME_FORMAT)
+    lines.append(f'DTSTART:{_to_utc(meeting.start_time).strftime(_ICS_DATETIME_FORMAT)}')
+    lines.append(f'DTEND:{_to_utc(meeting.end_time).strftime(_ICS_DATETIME_FORMAT)}')
+    lines.append(f'DTSTAMP:{created_at}')
+    lines.append(f'CREATED:{created_at}')
+    lines.append(f'LAST-MODIFIED:{_to_utc(meeting.updated_at).strftime(_ICS_DATETIME_FORMAT)}')
+    
+    buf = bytearray(b'BEGIN:VEVENT\r\n')
+    for line in lines:
+        buf += _fold_line(line.encode('utf-8'))
+    return bytes(buf)
+
+
+def _attendee_bytes(participant):
+    """
+    Render one folded ATTENDEE content line for a participant.
+    
+    Requirement: 4.4 - Format participant data as ATTENDEE fields
+    """
+    return _fold_line(
+        f'ATTENDEE;CN={_escape_param(participant.name)};ROLE=REQ-PARTICIPANT;'
+        f'RSVP=TRUE:MAILTO:{participant.email.translate(_ICS_CONTROL_CHARS)}'.encode('utf-8')
+    )
+
 
 class ConflictDetector:
     """
@@ -19,7 +188,6 @@ class ConflictDetector:
     
     Provides methods to:
     - Check if two meetings have overlapping time ranges
-    - Find conflicts for a specific participant
     - Find all conflicts for all participants in a meeting
     
     Requirements: 3.1, 3.2, 3.4
@@ -44,92 +212,177 @@ class ConflictDetector:
         
         Requirement: 3.2 - Time overlap detection logic
         """
-        # Handle both Meeting objects and dicts
-        start1 = meeting1.start_time if hasattr(meeting1, 'start_time') else meeting1['start_time']
-        end1 = meeting1.end_time if hasattr(meeting1, 'end_time') else meeting1['end_time']
-        start2 = meeting2.start_time if hasattr(meeting2, 'start_time') else meeting2['start_time']
-        end2 = meeting2.end_time if hasattr(meeting2, 'end_time') else meeting2['end_time']
-        
-        # Check for overlap: start_A < end_B AND start_B < end_A
+        # Handle both Meeting objects and dicts: dispatch once on the input
+        # type instead of probing every attribute with hasattr
+        is_dict1 = isinstance(meeting1, dict)
+        if is_dict1 == isinstance(meeting2, dict):
+            overlap = _overlap_dict if is_dict1 else _overlap_obj
+            return overlap(meeting1, meeting2)
+        
+        # Mixed inputs
+        start1, end1 = _time_range(meeting1)
+        start2, end2 = _time_range(meeting2)
         return start1 < end2 and start2 < end1
     
     @staticmethod
-    def check_participant_conflicts(participant_email, meeting, exclude_meeting_id=None):
+    def get_all_conflicts(meeting):
         """
-        Find all meetings that conflict with the given meeting for a specific participant.
+        Find all conflicts for all participants in a meeting.
+        
+        Returns a dictionary mapping participant emails to their conflicting meetings.
         
         Args:
-            participant_email (str): Email of the participant to check
-            meeting: Meeting object or dict with start_time and end_time
-            exclude_meeting_id (UUID, optional): Meeting ID to exclude from conflict check
-                                                  (useful when updating existing meetings)
+            meeting: Meeting object with participants
         
         Returns:
-            QuerySet: Meetings that conflict with the given meeting for this participant
+            dict: Dictionary with structure:
+                {
+                    'participant_email': [list of conflicting meeting dicts],
+                    ...
+                }
         
-        Requirements: 3.1, 3.2 - Participant conflict detection
+        Requirement: 3.4 - Complete conflict reporting for all participants
         """
-        # Get start and end times
-        start_time = meeting.start_time if hasattr(meeting, 'start_time') else meeting['start_time']
-        end_time = meeting.end_time if hasattr(meeting, 'end_time') else meeting['end_time']
+        # Get meeting ID to exclude from conflict checks
+        meeting_id = meeting.id if hasattr(meeting, 'id') else None
         
-        # Find all meetings where this participant is involved
-        participant_meetings = Meeting.objects.filter(
-            participants__email=participant_email
-        )
+        # Collect all participant emails for this meeting in a single query
+        if not hasattr(meeting, 'participants'):
+            return {}
+        emails = list(meeting.participants.values_list('email', flat=True))
+        if not emails:
+            return {}
         
-        # Exclude the current meeting if specified (for update scenarios)
-        if exclude_meeting_id:
-            participant_meetings = participant_meetings.exclude(id=exclude_meeting_id)
+        start_time = meeting.start_time
+        end_time = meeting.end_time
         
-        # Find overlapping meetings using database-level filtering
+        # Fetch every overlapping participation for those emails in one query
+        # instead of one query per participant. Each row carries the email and
+        # the conflicting meeting's columns, so grouping happens in a single
+        # pass without instantiating Meeting models.
         # Overlap condition: start_time < other_end_time AND other_start_time < end_time
-        conflicting_meetings = participant_meetings.filter(
-            Q(start_time__lt=end_time) & Q(end_time__gt=start_time)
+        rows = Participant.objects.filter(
+            email__in=emails,
+            meeting__start_time__lt=end_time,
+            meeting__end_time__gt=start_time
+        ).order_by('meeting__start_time')
+        
+        if meeting_id:
+            rows = rows.exclude(meeting_id=meeting_id)
+        
+        rows = rows.values_list(
+            'email', *(f'meeting__{field}' for field in CONFLICT_FIELDS)
         )
         
-        return conflicting_meetings
+        # Only participants who have conflicts end up in the result
+        conflicts = defaultdict(list)
+        for email, *values in rows:
+            conflicts[email].append(dict(zip(CONFLICT_FIELDS, values)))
+        
+        return dict(conflicts)
     
     @staticmethod
-    def get_all_conflicts(meeting):
+    def get_conflicts_for_meetings(meetings):
         """
-        Find all conflicts for all participants in a meeting.
+        Find all participant conflicts for several meetings at once.
         
-        Returns a dictionary mapping participant emails to their conflicting meetings.
+        The participants of every meeting are read in one query, and every
+        participation of those emails inside the meetings' overall time
+        window in another, so the cost does not grow with the number of
+        meetings checked. Each conflict dict has the same fields as those
+        returned by get_all_conflicts and may be shared between meetings.
         
         Args:
-            meeting: Meeting object with participants
+            meetings: Iterable of Meeting objects
         
         Returns:
-            dict: Dictionary with structure:
-                {
-                    'participant_email': [list of conflicting Meeting objects],
-                    ...
-                }
+            dict: Dictionary mapping each meeting ID to the
+                  {participant_email: [conflicting meeting dicts]} mapping
+                  get_all_conflicts would return for it
         
         Requirement: 3.4 - Complete conflict reporting for all participants
         """
-        conflicts = {}
+        meetings_by_id = {meeting.id: meeting for meeting in meetings}
+        if not meetings_by_id:
+            return {}
+        conflicts = {meeting_id: defaultdict(list) for meeting_id in meetings_by_id}
+        
+        # Map each email to the requested meetings it attends
+        attended = defaultdict(list)
+        for meeting_id, email in Participant.objects.filter(
+            meeting_id__in=meetings_by_id
+        ).values_list('meeting_id', 'email'):
+            attended[email].append(meetings_by_id[meeting_id])
+        
+        if attended:
+            window_start = min(meeting.start_time for meeting in meetings_by_id.values())
+            window_end = max(meeting.end_time for meeting in meetings_by_id.values())
+            rows = Participant.objects.filter(
+                email__in=list(attended),
+                meeting__start_time__lt=window_end,
+                meeting__end_time__gt=window_start
+            ).order_by('meeting__start_time').values_list(
+                'email', *(f'meeting__{field}' for field in CONFLICT_FIELDS)
+            )
+            
+            for email, *values in rows:
+                other = dict(zip(CONFLICT_FIELDS, values))
+                for meeting in attended[email]:
+                    # Overlap condition: start_time < other_end_time AND other_start_time < end_time
+                    if (other['id'] != meeting.id
+                            and meeting.start_time < other['end_time']
+                            and other['start_time'] < meeting.end_time):
+                        conflicts[meeting.id][email].append(other)
+        
+        return {meeting_id: dict(found) for meeting_id, found in conflicts.items()}
+    
+    @staticmethod
+    def find_overlaps(meetings):
+        """
+        Find every pair of overlapping meetings in a single sweep.
         
-        # Get meeting ID to exclude from conflict checks
-        meeting_id = meeting.id if hasattr(meeting, 'id') else None
+        Meetings are sorted by start_time and walked once while a min-heap
+        keyed on end_time tracks the meetings still in progress. Everything
+        left on the heap after popping meetings that ended at or before the
+        current start overlaps the current meeting, so the whole set is
+        processed in O(n log n + k) for k overlapping pairs instead of one
+        database query per meeting.
         
-        # Get all participants for this meeting
-        participants = meeting.participants.all() if hasattr(meeting, 'participants') else []
+        Args:
+            meetings: Iterable of Meeting objects
         
-        # Check conflicts for each participant
-        for participant in participants:
-            conflicting_meetings = ConflictDetector.check_participant_conflicts(
-                participant.email,
-                meeting,
-                exclude_meeting_id=meeting_id
-            )
+        Returns:
+            dict: Dictionary mapping meeting ID to a list of the Meeting objects
+                  it overlaps, ordered by start_time. Meetings without
+                  overlaps are omitted.
+        
+        Requirement: 3.2 - Time overlap detection logic
+        """
+        overlaps = defaultdict(list)
+        active = []
+        # Bind hot-loop callables to locals to skip global/attribute lookups
+        heappush, heappop = heapq.heappush, heapq.heappop
+        by_start = attrgetter('start_time')
+        
+        for index, meeting in enumerate(sorted(meetings, key=by_start)):
+            start_time = meeting.start_time
+            
+            # Drop meetings that ended before this one starts (adjacent is not overlap)
+            while active and active[0][0] <= start_time:
+                heappop(active)
             
-            # Only include participants who have conflicts
-            if conflicting_meetings.exists():
-                conflicts[participant.email] = list(conflicting_meetings)
+            if active:
+                current = overlaps[meeting.id]
+                for _, _, other in active:
+                    overlaps[other.id].append(meeting)
+                    current.append(other)
+            
+            heappush(active, (meeting.end_time, index, meeting))
+        
+        for overlapping in overlaps.values():
+            overlapping.sort(key=by_start)
         
-        return conflicts
+        return dict(overlaps)
     
     @staticmethod
     def has_conflicts(meeting):
@@ -142,8 +395,26 @@ class ConflictDetector:
         Returns:
             bool: True if any participant has conflicts, False otherwise
         """
-        conflicts = ConflictDetector.get_all_conflicts(meeting)
-        return len(conflicts) > 0
+        if not hasattr(meeting, 'participants'):
+            return False
+        
+        # A single EXISTS query: stop at the first conflicting meeting instead
+        # of collecting every conflict for every participant. The participant
+        # emails and matching meeting IDs are nested subqueries rather than a
+        # separate query and a JOIN through participants, so a meeting shared
+        # by several of these emails is not repeated.
+        shared_meeting_ids = Participant.objects.filter(
+            email__in=meeting.participants.values('email')
+        ).values('meeting_id')
+        conflicting_meetings = Meeting.objects.filter(
+            id__in=shared_meeting_ids,
+            start_time__lt=meeting.end_time,
+            end_time__gt=meeting.start_time
+        )
+        if getattr(meeting, 'id', None):
+            conflicting_meetings = conflicting_meetings.exclude(id=meeting.id)
+        
+        return conflicting_meetings.exists()
 
 
 
@@ -151,150 +422,123 @@ class ICSGenerator:
     """
     Service class for generating RFC 5545 compliant ICS (iCalendar) files.
     
-    Provides methods to:
-    - Convert Meeting model to iCalendar event
-    - Format participant data as ATTENDEE fields
-    - Generate complete ICS file content
+    Content lines are written straight to bytes by _event_head_bytes and
+    _attendee_bytes, which both the single-meeting and the full-calendar
+    exports use. Provides methods to:
+    - Stream a calendar for one meeting or for a whole queryset
+    - Render a single meeting as a VEVENT block
     
     Requirements: 4.1, 4.2, 4.4, 4.5
     """
     
     @staticmethod
-    def create_calendar_event(meeting):
+    def prefetch_attendees(queryset):
         """
-        Create an iCalendar event from a Meeting object.
+        Prefetch the participant columns needed for ATTENDEE fields.
+        
+        Only email and name are loaded (plus the meeting foreign key needed
+        to attach each participant to its meeting), so ICS generation does
+        not fetch unused columns or issue a participants query per meeting.
         
         Args:
-            meeting: Meeting object with all fields populated
+            queryset: Meeting QuerySet
         
         Returns:
-            Event: iCalendar Event object
+            QuerySet: The queryset with participants prefetched
         
-        Requirement: 4.2 - Convert Meeting model to iCalendar event
+        Requirement: 4.4
         """
-        event = Event()
-        
-        # Add unique identifier
-        event.add('uid', str(meeting.id))
-        
-        # Add meeting title as SUMMARY
-        event.add('summary', meeting.title)
-        
-        # Add description if present
-        if meeting.description:
-            event.add('description', meeting.description)
-        
-        # Add start and end times with UTC timezone
-        # Requirement: 4.5 - Proper timezone handling (UTC)
-        utc = timezone.utc
-        
-        # Ensure times are timezone-aware and in UTC
-        start_time = meeting.start_time
-        end_time = meeting.end_time
-        
-        if start_time.tzinfo is None:
-            start_time = start_time.replace(tzinfo=utc)
-        else:
-            start_time = start_time.astimezone(utc)
-        
-        if end_time.tzinfo is None:
-            end_time = end_time.replace(tzinfo=utc)
-        else:
-            end_time = end_time.astimezone(utc)
-        
-        event.add('dtstart', start_time)
-        event.add('dtend', end_time)
-        
-        # Add timestamps
-        created_at = meeting.created_at
-        if created_at.tzinfo is None:
-            created_at = created_at.replace(tzinfo=utc)
-        else:
-            created_at = created_at.astimezone(utc)
-        
-        event.add('dtstamp', created_at)
-        event.add('created', created_at)
-        
-        updated_at = meeting.updated_at
-        if updated_at.tzinfo is None:
-            updated_at = updated_at.replace(tzinfo=utc)
-        else:
-            updated_at = updated_at.astimezone(utc)
-        
-        event.add('last-modified', updated_at)
-        
-        return event
+        # Replace any participants prefetch already on the queryset but keep
+        # the other lookups; prefetch_related(None) alone would clear them all
+        kept = [
+            lookup for lookup in queryset._prefetch_related_lookups
+            if getattr(lookup, 'prefetch_to', lookup) != 'participants'
+        ]
+        return queryset.prefetch_related(None).prefetch_related(
+            Prefetch('participants', queryset=Participant.objects.only('meeting', 'email', 'name')),
+            *kept
+        )
     
     @staticmethod
-    def format_attendees(participants):
+    def event_bytes(meeting):
         """
-        Format participant data as ATTENDEE fields per RFC 5545.
+        Render a single VEVENT block as RFC 5545 content lines.
+        
+        Callers should load the meeting through prefetch_attendees() so that
+        meeting.participants.all() is served from the prefetch cache.
         
         Args:
-            participants: QuerySet or list of Participant objects
+            meeting: Meeting object with all fields populated
         
         Returns:
-            list: List of vCalAddress objects formatted as ATTENDEE fields
+            bytes: CRLF-terminated, folded BEGIN:VEVENT ... END:VEVENT block
         
-        Requirement: 4.4 - Format participant data as ATTENDEE fields per RFC 5545
+        Requirements: 4.2, 4.4, 4.5
         """
-        attendees = []
-        
-        for participant in participants:
-            # Create calendar address for the participant
-            attendee = vCalAddress(f'MAILTO:{participant.email}')
-            
-            # Add common name (CN) parameter
-            attendee.params['cn'] = vText(participant.name)
-            
-            # Add role parameter (REQ-PARTICIPANT is standard for required attendees)
-            attendee.params['role'] = vText('REQ-PARTICIPANT')
-            
-            # Add RSVP parameter (request response)
-            attendee.params['rsvp'] = vText('TRUE')
-            
-            attendees.append(attendee)
+        buf = bytearray(_event_head_bytes(meeting))
+        for participant in meeting.participants.all():
+            buf += _attendee_bytes(participant)
+        buf += b'END:VEVENT\r\n'
         
-        return attendees
+        return bytes(buf)
     
     @staticmethod
-    def generate_ics(meeting):
+    def stream_ics(queryset, chunk_size=500):
         """
-        Generate complete ICS file content for a meeting.
+        Stream a calendar containing every meeting in a queryset.
+        
+        Yields the calendar header, one VEVENT block per meeting and the
+        footer, so memory use stays constant regardless of how many meetings
+        are exported. Meetings are read from the database in chunks with
+        their attendees prefetched per chunk.
         
         Args:
-            meeting: Meeting object with participants
+            queryset: Meeting QuerySet to export
+            chunk_size (int): Number of meetings fetched per database round-trip
         
-        Returns:
-            bytes: ICS file content as bytes
+        Yields:
+            bytes: Pieces of the ICS file content
         
-        Requirements: 4.1, 4.2, 4.4, 4.5
+        Requirements: 4.1, 4.4, 4.5
         """
-        # Create calendar
-        cal = Calendar()
-        
-        # Add required calendar properties
-        cal.add('prodid', '-//Meeting Scheduler//Meeting Scheduler API//EN')
-        cal.add('version', '2.0')
-        cal.add('calscale', 'GREGORIAN')
-        cal.add('method', 'PUBLISH')
+        yield _ICS_CALENDAR_HEADER
         
-        # Create event from meeting
-        event = ICSGenerator.create_calendar_event(meeting)
+        for meeting in ICSGenerator.prefetch_attendees(queryset).iterator(chunk_size=chunk_size):
+            yield ICSGenerator.event_bytes(meeting)
         
-        # Add attendees to event
-        # Requirement: 4.4 - Format participant data as ATTENDEE fields
-        participants = meeting.participants.all() if hasattr(meeting, 'participants') else []
-        attendees = ICSGenerator.format_attendees(participants)
+        yield _ICS_CALENDAR_FOOTER
+    
+    @staticmethod
+    def stream_meeting_ics(meeting, chunk_size=200):
+        """
+        Stream a calendar for a single meeting.
         
-        for attendee in attendees:
-            event.add('attendee', attendee, encode=0)
+        Participants are read with a server-side iterator and their ATTENDEE
+        lines are accumulated in one buffer that is flushed every chunk_size
+        participants, so meetings with very large attendee lists are never
+        held in memory at once and the response is not split into one tiny
+        write per attendee.
         
-        # Add event to calendar
-        cal.add_component(event)
+        Args:
+            meeting: Meeting object with all fields populated
+            chunk_size (int): Number of participants fetched per database
+                              round-trip and written per yielded chunk
         
-        # Generate ICS content
-        # Requirement: 4.5 - Follow RFC 5545 iCalendar format standards
-        ics_content = cal.to_ical()
+        Yields:
+            bytes: Pieces of the ICS file content
         
-        return ics_content
+        Requirements: 4.1, 4.4, 4.5
+        """
+        buf = bytearray(_ICS_CALENDAR_HEADER)
+        buf += _event_head_bytes(meeting)
+        
+        participants = meeting.participants.only('meeting', 'email', 'name')
+        for count, participant in enumerate(participants.iterator(chunk_size=chunk_size), 1):
+            buf += _attendee_bytes(participant)
+            if count % chunk_size == 0:
+                yield bytes(buf)
+                buf.clear()
+        
+        buf += b'END:VEVENT\r\n'
+        buf += _ICS_CALENDAR_FOOTER
+        yield bytes(buf)
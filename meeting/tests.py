@@ -3,14 +3,39 @@ Tests for Meeting Scheduler API.
 
 This module contains tests for the Meeting CRUD API endpoints.
 """
-from django.test import TestCase
-from rest_framework.test import APITestCase, APIClient
-from rest_framework import status
-from django.utils import timezone
-from datetime import timedelta, datetime
-from .models import Meeting, Participant
-from .services import ConflictDetector
+import gzip
 import json
+import re
+import uuid
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APITestCase
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+from django.urls import reverse
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Prefetch
+from datetime import timedelta, datetime, timezone as dt_timezone
+from .exceptions import exception_handler
+from .models import Meeting, Participant
+from .serializers import MeetingListSerializer, MeetingReadSerializer, MeetingSerializer, ParticipantSerializer
+from .services import ConflictDetector, ICSGenerator
+from .views import MeetingViewSet
+from icalendar import Calendar
+
+
+# Pinned reference instant for class-level fixtures, so timestamps derived
+# from it are identical on every run
+_FIXED_NOW = datetime(2025, 1, 1, 9, 0, tzinfo=dt_timezone.utc)
+
+# Offsets shared by the fixtures below
+_H1, _H2, _H3, _H4 = (timedelta(hours=h) for h in (1, 2, 3, 4))
+_D1, _D2, _D5 = (timedelta(days=d) for d in (1, 2, 5))
+
+# RFC 5545 line folding: a line break followed by a single space
+_UNFOLD_RE = re.compile(r'\r?\n ')
 
 
 class MeetingCRUDTestCase(APITestCase):
@@ -20,18 +45,21 @@ class MeetingCRUDTestCase(APITestCase):
     Tests Requirements: 1.1, 5.1, 5.2, 5.3, 5.4, 5.5, 7.1, 7.5
     """
     
-    def setUp(self):
-        """Set up test client and sample data."""
-        self.client = APIClient()
-        self.base_url = '/api/meetings/'
+    base_url = '/api/meetings/'
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Build shared timestamps and sample meeting data once per class."""
+        cls.now = _FIXED_NOW
+        cls.t1h = cls.now + _H1
+        cls.t2h = cls.now + _H2
         
         # Create sample meeting data
-        self.now = timezone.now()
-        self.valid_meeting_data = {
+        cls.valid_meeting_data = {
             'title': 'Test Meeting',
             'description': 'Test Description',
-            'start_time': (self.now + timedelta(hours=1)).isoformat(),
-            'end_time': (self.now + timedelta(hours=2)).isoformat(),
+            'start_time': cls.t1h.isoformat(),
+            'end_time': cls.t2h.isoformat(),
         }
     
     def test_create_meeting_success(self):
@@ -41,8 +69,8 @@ class MeetingCRUDTestCase(APITestCase):
         """
         response = self.client.post(
             self.base_url,
-            data=json.dumps(self.valid_meeting_data),
-            content_type='application/json'
+            data=self.valid_meeting_data,
+            format='json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -56,16 +84,16 @@ class MeetingCRUDTestCase(APITestCase):
         Requirement: 1.2
         """
         invalid_data = self.valid_meeting_data.copy()
-        invalid_data['end_time'] = (self.now - timedelta(hours=1)).isoformat()
+        invalid_data['end_time'] = (self.now - _H1).isoformat()
         
         response = self.client.post(
             self.base_url,
-            data=json.dumps(invalid_data),
-            content_type='application/json'
+            data=invalid_data,
+            format='json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('end_time', str(response.data))
+        self.assertIn('end_time', response.data)
     
     def test_create_meeting_missing_required_fields(self):
         """
@@ -76,12 +104,61 @@ class MeetingCRUDTestCase(APITestCase):
         
         response = self.client.post(
             self.base_url,
-            data=json.dumps(invalid_data),
-            content_type='application/json'
+            data=invalid_data,
+            format='json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
     
+    def test_validate_reports_all_missing_fields(self):
+        """
+        Test that object-level validation reports every missing field at once.
+        Requirements: 1.3, 7.3
+        """
+        with self.assertRaises(ValidationError) as ctx:
+            MeetingSerializer().validate({'description': 'Only description'})
+        
+        self.assertEqual(
+            set(ctx.exception.detail),
+            {'title', 'start_time', 'end_time'}
+        )
+    
+    def test_read_serializer_matches_writable_output(self):
+        """
+        Test that the read-only serializer renders exactly what MeetingSerializer does.
+        Requirements: 5.1, 5.4
+        """
+        meeting = Meeting.objects.create(
+            title='Test Meeting',
+            description='Test Description',
+            start_time=self.t1h,
+            end_time=self.t2h
+        )
+        Participant.objects.create(meeting=meeting, email='alice@example.com', name='Alice')
+        
+        read_serializer = MeetingReadSerializer(meeting)
+        
+        self.assertTrue(all(field.read_only for field in read_serializer.fields.values()))
+        self.assertEqual(read_serializer.data, MeetingSerializer(meeting).data)
+    
+    def test_list_serializer_matches_default_list_output(self):
+        """
+        Test that MeetingListSerializer renders the same rows as DRF's ListSerializer.
+        Requirements: 5.4, 6.1
+        """
+        meetings = Meeting.objects.bulk_create([
+            Meeting(title='First', start_time=self.t1h, end_time=self.t2h),
+            Meeting(title='Second', description='Has a description', start_time=self.t2h, end_time=self.t2h + _H1),
+        ])
+        Participant.objects.create(meeting=meetings[0], email='alice@example.com', name='Alice')
+        queryset = Meeting.objects.prefetch_related('participants')
+        
+        serializer = MeetingReadSerializer(queryset, many=True)
+        default = serializers.ListSerializer(queryset, child=MeetingReadSerializer())
+        
+        self.assertIsInstance(serializer, MeetingListSerializer)
+        self.assertEqual(serializer.data, default.data)
+    
     def test_retrieve_meeting(self):
         """
         Test retrieving a specific meeting by ID.
@@ -91,8 +168,8 @@ class MeetingCRUDTestCase(APITestCase):
         meeting = Meeting.objects.create(
             title='Test Meeting',
             description='Test Description',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
+            start_time=self.t1h,
+            end_time=self.t2h
         )
         
         response = self.client.get(f'{self.base_url}{meeting.id}/')
@@ -101,6 +178,30 @@ class MeetingCRUDTestCase(APITestCase):
         self.assertEqual(response.data['id'], str(meeting.id))
         self.assertEqual(response.data['title'], 'Test Meeting')
     
+    def test_retrieve_meeting_participants(self):
+        """
+        Test that nested participants match ParticipantSerializer output.
+        Requirement: 5.1
+        """
+        meeting = Meeting.objects.create(
+            title='Test Meeting',
+            start_time=self.t1h,
+            end_time=self.t2h
+        )
+        participant = Participant.objects.create(
+            meeting=meeting,
+            email='alice@example.com',
+            name='Alice Smith'
+        )
+        
+        response = self.client.get(f'{self.base_url}{meeting.id}/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['participants'],
+            [ParticipantSerializer(participant).data]
+        )
+    
     def test_retrieve_nonexistent_meeting(self):
         """
         Test retrieving a meeting that doesn't exist.
@@ -112,6 +213,18 @@ class MeetingCRUDTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertIn('error', response.data)
     
+    def test_malformed_meeting_id_rejected_without_query(self):
+        """
+        Test that non-UUID meeting ids are rejected by URL resolution.
+        Requirement: 7.1
+        """
+        for url in (f'{self.base_url}not-a-uuid/', f'{self.base_url}not-a-uuid/export/'):
+            with self.subTest(url=url):
+                with self.assertNumQueries(0):
+                    response = self.client.get(url)
+                
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
     def test_update_meeting(self):
         """
         Test updating a meeting.
@@ -121,21 +234,21 @@ class MeetingCRUDTestCase(APITestCase):
         meeting = Meeting.objects.create(
             title='Original Title',
             description='Original Description',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
+            start_time=self.t1h,
+            end_time=self.t2h
         )
         
         update_data = {
             'title': 'Updated Title',
             'description': 'Updated Description',
-            'start_time': (self.now + timedelta(hours=3)).isoformat(),
-            'end_time': (self.now + timedelta(hours=4)).isoformat(),
+            'start_time': (self.now + _H3).isoformat(),
+            'end_time': (self.now + _H4).isoformat(),
         }
         
         response = self.client.put(
             f'{self.base_url}{meeting.id}/',
-            data=json.dumps(update_data),
-            content_type='application/json'
+            data=update_data,
+            format='json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -151,8 +264,8 @@ class MeetingCRUDTestCase(APITestCase):
         meeting = Meeting.objects.create(
             title='Test Meeting',
             description='Test Description',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
+            start_time=self.t1h,
+            end_time=self.t2h
         )
         
         response = self.client.delete(f'{self.base_url}{meeting.id}/')
@@ -170,13 +283,13 @@ class MeetingCRUDTestCase(APITestCase):
         # Create multiple meetings
         Meeting.objects.create(
             title='Meeting 1',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
+            start_time=self.t1h,
+            end_time=self.t2h
         )
         Meeting.objects.create(
             title='Meeting 2',
-            start_time=self.now + timedelta(hours=3),
-            end_time=self.now + timedelta(hours=4)
+            start_time=self.now + _H3,
+            end_time=self.now + _H4
         )
         
         response = self.client.get(self.base_url)
@@ -184,6 +297,133 @@ class MeetingCRUDTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 2)
     
+    def test_list_meetings_does_not_lazy_load_participants(self):
+        """
+        Test that listing meetings loads participants in one prefetch query.
+        Requirement: 5.4
+        """
+        meetings = Meeting.objects.bulk_create([
+            Meeting(
+                title=f'Meeting {i}',
+                start_time=self.now + timedelta(hours=i),
+                end_time=self.now + timedelta(hours=i, minutes=30)
+            )
+            for i in range(1, 11)
+        ])
+        Participant.objects.bulk_create([
+            Participant(meeting=meeting, email=f'user{j}@example.com', name=f'User {j}')
+            for meeting in meetings
+            for j in range(3)
+        ])
+        
+        # One query for meetings, one for all of their participants
+        with self.assertNumQueries(2):
+            response = self.client.get(self.base_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 10)
+        self.assertTrue(all(len(m['participants']) == 3 for m in response.data))
+    
+    def test_list_meetings_streams_on_request(self):
+        """
+        Test that stream=1 streams the same JSON array the regular list returns.
+        Requirement: 5.4
+        """
+        meetings = Meeting.objects.bulk_create([
+            Meeting(
+                title=f'Meeting {i}',
+                start_time=self.now + timedelta(minutes=i),
+                end_time=self.now + timedelta(minutes=i + 30)
+            )
+            for i in range(1, 1202)
+        ])
+        Participant.objects.create(meeting=meetings[0], email='alice@example.com', name='Alice')
+        Meeting.objects.filter(pk=meetings[0].pk).update(title='Line\u2028break')
+        
+        # Without the opt-in, large lists still go through the renderer
+        regular = self.client.get(self.base_url)
+        self.assertFalse(regular.streaming)
+        
+        # Meetings are read in one query; participants are prefetched per chunk
+        with self.assertNumQueries(4):
+            response = self.client.get(f'{self.base_url}?stream=1')
+            content = b''.join(response.streaming_content)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(content, regular.content)
+        
+        # Rendered like JSONRenderer, which escapes the JavaScript line separators
+        self.assertIn(b'Line\\u2028break', content)
+        data = json.loads(content)
+        self.assertEqual(len(data), 1201)
+        self.assertEqual(data[0]['participants'][0]['email'], 'alice@example.com')
+    
+    def test_list_stream_error_ends_the_body(self):
+        """
+        Test that an error while streaming the list is raised, not hidden in the body.
+        Requirement: 5.4
+        """
+        Meeting.objects.create(
+            title='Streamed Meeting',
+            start_time=self.now + _H1,
+            end_time=self.now + _H2
+        )
+        response = self.client.get(f'{self.base_url}?stream=1')
+        
+        # The status is already sent; the error cuts the JSON array short
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        with mock.patch.object(MeetingViewSet, 'get_serializer', side_effect=RuntimeError('boom')):
+            with self.assertRaises(RuntimeError):
+                b''.join(response.streaming_content)
+    
+    def test_list_meetings_gzipped_on_request(self):
+        """
+        Test that list responses are gzip-compressed for clients that accept it.
+        Requirement: 5.4
+        """
+        Meeting.objects.bulk_create([
+            Meeting(
+                title=f'Meeting {i}',
+                start_time=self.now + timedelta(hours=i),
+                end_time=self.now + timedelta(hours=i, minutes=30)
+            )
+            for i in range(1, 6)
+        ])
+        
+        response = self.client.get(self.base_url, HTTP_ACCEPT_ENCODING='gzip')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response['Vary'])
+        self.assertEqual(len(json.loads(gzip.decompress(response.content))), 5)
+    
+    def test_list_meetings_cursor_pagination(self):
+        """
+        Test that page_size pages through meetings in start_time order by cursor.
+        Requirement: 5.4
+        """
+        Meeting.objects.bulk_create([
+            Meeting(
+                title=f'Meeting {i}',
+                start_time=self.now + timedelta(hours=i),
+                end_time=self.now + timedelta(hours=i, minutes=30)
+            )
+            for i in (3, 1, 2)
+        ])
+        
+        titles = []
+        url = f'{self.base_url}?page_size=2'
+        while url:
+            # One query for the page of meetings, one for their participants
+            with self.assertNumQueries(2):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles.extend(m['title'] for m in response.data['results'])
+            url = response.data['next']
+        
+        self.assertEqual(titles, ['Meeting 1', 'Meeting 2', 'Meeting 3'])
+    
     def test_list_meetings_with_date_filter(self):
         """
         Test listing meetings with date range filtering.
@@ -192,12 +432,12 @@ class MeetingCRUDTestCase(APITestCase):
         # Create meetings at different times
         meeting1 = Meeting.objects.create(
             title='Meeting 1',
-            start_time=self.now + timedelta(days=1),
+            start_time=self.now + _D1,
             end_time=self.now + timedelta(days=1, hours=1)
         )
         meeting2 = Meeting.objects.create(
             title='Meeting 2',
-            start_time=self.now + timedelta(days=5),
+            start_time=self.now + _D5,
             end_time=self.now + timedelta(days=5, hours=1)
         )
         meeting3 = Meeting.objects.create(
@@ -208,18 +448,35 @@ class MeetingCRUDTestCase(APITestCase):
         
         # Filter for meetings in the first week
         # Use replace to ensure proper ISO format without microseconds
-        from urllib.parse import quote
         start_date = (self.now).replace(microsecond=0).isoformat()
         end_date = (self.now + timedelta(days=7)).replace(microsecond=0).isoformat()
         
-        # URL encode the dates to preserve the + sign
+        # Pass the dates as query data so the client encodes the + sign
         response = self.client.get(
-            f'{self.base_url}?start_date={quote(start_date)}&end_date={quote(end_date)}'
+            self.base_url,
+            {'start_date': start_date, 'end_date': end_date}
         )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 2)  # Should only get meeting1 and meeting2
 
+    def test_bulk_create_enforces_time_range(self):
+        """
+        Test that the database rejects bulk-created meetings ending before they start.
+        Requirement: 1.2
+        """
+        invalid_meeting = Meeting(
+            title='Invalid Meeting',
+            start_time=self.t2h,
+            end_time=self.t1h
+        )
+
+        with self.assertRaises(IntegrityError):
+            with transaction.atomic():
+                Meeting.objects.bulk_create([invalid_meeting])
+
+        self.assertEqual(Meeting.objects.count(), 0)
+
 
 class ParticipantManagementTestCase(APITestCase):
     """
@@ -228,21 +485,24 @@ class ParticipantManagementTestCase(APITestCase):
     Tests Requirements: 2.1, 2.2, 2.3, 2.4
     """
     
-    def setUp(self):
-        """Set up test client and sample data."""
-        self.client = APIClient()
-        self.base_url = '/api/meetings/'
+    base_url = '/api/meetings/'
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create sample data once for the whole class."""
+        cls.now = _FIXED_NOW
+        cls.t1h = cls.now + _H1
+        cls.t2h = cls.now + _H2
         
         # Create a sample meeting
-        self.now = timezone.now()
-        self.meeting = Meeting.objects.create(
+        cls.meeting = Meeting.objects.create(
             title='Test Meeting',
             description='Test Description',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
+            start_time=cls.t1h,
+            end_time=cls.t2h
         )
         
-        self.valid_participant_data = {
+        cls.valid_participant_data = {
             'email': 'participant@example.com',
             'name': 'Test Participant'
         }
@@ -254,8 +514,8 @@ class ParticipantManagementTestCase(APITestCase):
         """
         response = self.client.post(
             f'{self.base_url}{self.meeting.id}/participants/',
-            data=json.dumps(self.valid_participant_data),
-            content_type='application/json'
+            data=self.valid_participant_data,
+            format='json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -263,32 +523,38 @@ class ParticipantManagementTestCase(APITestCase):
         self.assertEqual(response.data['email'], 'participant@example.com')
         self.assertEqual(response.data['name'], 'Test Participant')
         
-        # Verify participant is in database
+        # Verify the returned participant was stored against this meeting
         self.assertTrue(
-            Participant.objects.filter(
-                meeting=self.meeting,
-                email='participant@example.com'
-            ).exists()
+            Participant.objects.filter(pk=response.data['id'], meeting=self.meeting).exists()
         )
     
+    def test_add_participant_normalizes_email(self):
+        """
+        Test that participant emails are stripped and lowercased.
+        Requirement: 7.3
+        """
+        response = self.client.post(
+            f'{self.base_url}{self.meeting.id}/participants/',
+            data={'email': '  Participant@Example.COM ', 'name': 'Test Participant'},
+            format='json'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['email'], 'participant@example.com')
+
     def test_add_duplicate_participant(self):
         """
         Test adding the same participant twice to prevent duplicates.
         Requirement: 2.2
         """
         # Add participant first time
-        response1 = self.client.post(
-            f'{self.base_url}{self.meeting.id}/participants/',
-            data=json.dumps(self.valid_participant_data),
-            content_type='application/json'
-        )
-        self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
+        Participant.objects.create(meeting=self.meeting, **self.valid_participant_data)
         
         # Try to add the same participant again
         response2 = self.client.post(
             f'{self.base_url}{self.meeting.id}/participants/',
-            data=json.dumps(self.valid_participant_data),
-            content_type='application/json'
+            data=self.valid_participant_data,
+            format='json'
         )
         
         self.assertEqual(response2.status_code, status.HTTP_409_CONFLICT)
@@ -301,6 +567,95 @@ class ParticipantManagementTestCase(APITestCase):
         ).count()
         self.assertEqual(count, 1)
     
+    def test_add_participants_bulk(self):
+        """
+        Test adding several participants at once, skipping duplicates.
+        Requirements: 2.1, 2.2
+        """
+        Participant.objects.create(meeting=self.meeting, email='Alice@Example.com', name='Alice')
+        
+        # meeting, existing emails, INSERT, inserted ids, updated_at bump
+        with self.assertNumQueries(5):
+            response = self.client.post(
+                f'{self.base_url}{self.meeting.id}/participants/bulk/',
+                {'participants': [
+                    {'email': 'alice@example.com', 'name': 'Alice'},
+                    {'email': 'bob@example.com', 'name': 'Bob'},
+                    {'email': 'BOB@example.com', 'name': 'Bob again'},
+                    {'email': 'carol@example.com', 'name': 'Carol'},
+                ]},
+                format='json'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [p['email'] for p in response.data['created']],
+            ['bob@example.com', 'carol@example.com']
+        )
+        self.assertEqual(response.data['skipped'], ['alice@example.com', 'bob@example.com'])
+        self.assertEqual(self.meeting.participants.count(), 3)
+    
+    def test_add_participants_bulk_validation(self):
+        """
+        Test that invalid bulk adds are rejected once the meeting is found.
+        Requirements: 2.4, 7.3
+        """
+        missing_url = f'{self.base_url}{uuid.uuid4()}/participants/bulk/'
+        for payload in (
+            {},
+            {'participants': []},
+            {'participants': [{'email': 'bad', 'name': 'X'}]},
+            [{'email': 'a@b.com', 'name': 'A'}],
+        ):
+            with self.subTest(payload=payload):
+                # Only the meeting is read before validation fails
+                with self.assertNumQueries(1):
+                    response = self.client.post(
+                        f'{self.base_url}{self.meeting.id}/participants/bulk/', payload, format='json'
+                    )
+                
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('participants', response.data)
+                
+                # As with single adds, a missing meeting is a 404 whatever the body
+                response = self.client.post(missing_url, payload, format='json')
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
+    def test_add_duplicate_participant_differing_in_case(self):
+        """
+        Test that a stored mixed-case email is found without attempting an INSERT.
+        Requirement: 2.2
+        """
+        Participant.objects.create(meeting=self.meeting, email='Participant@Example.com', name='Test')
+        
+        # meeting, participants prefetch, duplicate lookup
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                f'{self.base_url}{self.meeting.id}/participants/',
+                data=self.valid_participant_data,
+                format='json'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+    
+    def test_duplicate_participant_email_case_insensitive(self):
+        """
+        Test that the database rejects emails differing only in case.
+        Requirement: 2.2
+        """
+        Participant.objects.create(
+            meeting=self.meeting,
+            email='participant@example.com',
+            name='Participant'
+        )
+        
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Participant.objects.create(
+                meeting=self.meeting,
+                email='Participant@Example.com',
+                name='Participant'
+            )
+    
     def test_remove_participant_success(self):
         """
         Test removing a participant from a meeting.
@@ -314,37 +669,68 @@ class ParticipantManagementTestCase(APITestCase):
         )
         
         # Remove the participant
-        from urllib.parse import quote
         response = self.client.delete(
-            f'{self.base_url}{self.meeting.id}/participants/{quote("participant@example.com")}/'
+            reverse('meeting-remove-participant', kwargs={
+                'pk': self.meeting.id,
+                'participant_email': 'participant@example.com'
+            })
         )
         
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
-        # Verify participant is removed
-        self.assertFalse(
-            Participant.objects.filter(
-                meeting=self.meeting,
-                email='participant@example.com'
-            ).exists()
+        # Verify participant is removed while the meeting still exists
+        # (data integrity)
+        self.assertFalse(self.meeting.participants.exists())
+        self.assertTrue(Meeting.objects.filter(id=self.meeting.id).exists())
+    
+    def test_remove_participant_case_insensitive(self):
+        """
+        Test removing a participant whose stored email differs only in case.
+        Requirement: 2.3
+        """
+        Participant.objects.create(
+            meeting=self.meeting,
+            email='Participant@Example.com',
+            name='Test Participant'
         )
         
-        # Verify meeting still exists (data integrity)
-        self.assertTrue(Meeting.objects.filter(id=self.meeting.id).exists())
+        response = self.client.delete(
+            reverse('meeting-remove-participant', kwargs={
+                'pk': self.meeting.id,
+                'participant_email': 'participant@example.com'
+            })
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(self.meeting.participants.exists())
     
     def test_remove_nonexistent_participant(self):
         """
         Test removing a participant that doesn't exist.
         Requirement: 2.3
         """
-        from urllib.parse import quote
         response = self.client.delete(
-            f'{self.base_url}{self.meeting.id}/participants/{quote("nonexistent@example.com")}/'
+            reverse('meeting-remove-participant', kwargs={
+                'pk': self.meeting.id,
+                'participant_email': 'nonexistent@example.com'
+            })
         )
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertIn('error', response.data)
     
+    def test_remove_participant_rejects_malformed_email(self):
+        """
+        Test that a malformed email is rejected by URL resolution without a query.
+        Requirement: 2.3
+        """
+        with self.assertNumQueries(0):
+            response = self.client.delete(
+                f'{self.base_url}{self.meeting.id}/participants/not-an-email/'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
     def test_participant_list_in_meeting_detail(self):
         """
         Test that participant list is included in meeting detail response.
@@ -362,8 +748,9 @@ class ParticipantManagementTestCase(APITestCase):
             name='Participant 2'
         )
         
-        # Retrieve the meeting
-        response = self.client.get(f'{self.base_url}{self.meeting.id}/')
+        # Retrieve the meeting: one query for the meeting, one for participants
+        with self.assertNumQueries(2):
+            response = self.client.get(f'{self.base_url}{self.meeting.id}/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('participants', response.data)
@@ -374,6 +761,30 @@ class ParticipantManagementTestCase(APITestCase):
         self.assertIn('participant1@example.com', emails)
         self.assertIn('participant2@example.com', emails)
     
+    def test_meeting_detail_revalidates_with_etag(self):
+        """
+        Test that a matching If-None-Match gets 304 until the participants change.
+        Requirement: 5.1
+        """
+        detail_url = f'{self.base_url}{self.meeting.id}/'
+        etag = self.client.get(detail_url)['ETag']
+        
+        # Only the meeting lookup runs; participants are not loaded
+        with self.assertNumQueries(1):
+            response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        
+        self.client.post(
+            f'{self.base_url}{self.meeting.id}/participants/',
+            data=self.valid_participant_data,
+            format='json'
+        )
+        
+        response = self.client.get(detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(len(response.data['participants']), 1)
+    
     def test_add_participant_to_nonexistent_meeting(self):
         """
         Test adding a participant to a meeting that doesn't exist.
@@ -382,8 +793,8 @@ class ParticipantManagementTestCase(APITestCase):
         fake_uuid = '00000000-0000-0000-0000-000000000000'
         response = self.client.post(
             f'{self.base_url}{fake_uuid}/participants/',
-            data=json.dumps(self.valid_participant_data),
-            content_type='application/json'
+            data=self.valid_participant_data,
+            format='json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -398,116 +809,97 @@ class ParticipantManagementTestCase(APITestCase):
         meeting2 = Meeting.objects.create(
             title='Second Meeting',
             description='Second Description',
-            start_time=self.now + timedelta(hours=3),
-            end_time=self.now + timedelta(hours=4)
+            start_time=self.now + _H3,
+            end_time=self.now + _H4
         )
         
         # Add same participant to both meetings
-        self.client.post(
-            f'{self.base_url}{self.meeting.id}/participants/',
-            data=json.dumps(self.valid_participant_data),
-            content_type='application/json'
-        )
-        self.client.post(
-            f'{self.base_url}{meeting2.id}/participants/',
-            data=json.dumps(self.valid_participant_data),
-            content_type='application/json'
-        )
-        
-        # Verify participant exists in both meetings
-        self.assertTrue(
-            Participant.objects.filter(
-                meeting=self.meeting,
-                email='participant@example.com'
-            ).exists()
-        )
-        self.assertTrue(
-            Participant.objects.filter(
-                meeting=meeting2,
-                email='participant@example.com'
-            ).exists()
-        )
+        Participant.objects.bulk_create([
+            Participant(meeting=self.meeting, **self.valid_participant_data),
+            Participant(meeting=meeting2, **self.valid_participant_data),
+        ])
         
         # Remove participant from first meeting
-        from urllib.parse import quote
-        self.client.delete(
-            f'{self.base_url}{self.meeting.id}/participants/{quote("participant@example.com")}/'
+        response = self.client.delete(
+            reverse('meeting-remove-participant', kwargs={
+                'pk': self.meeting.id,
+                'participant_email': 'participant@example.com'
+            })
         )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         
         # Verify participant is removed from first meeting but still in second
-        self.assertFalse(
-            Participant.objects.filter(
-                meeting=self.meeting,
-                email='participant@example.com'
-            ).exists()
-        )
-        self.assertTrue(
-            Participant.objects.filter(
-                meeting=meeting2,
-                email='participant@example.com'
-            ).exists()
-        )
+        remaining = Participant.objects.filter(
+            meeting__in=[self.meeting, meeting2],
+            email='participant@example.com'
+        ).values_list('meeting_id', flat=True)
+        self.assertEqual(list(remaining), [meeting2.id])
 
 
 
-class ConflictDetectorTestCase(TestCase):
+class ConflictTestDataMixin:
     """
-    Test case for ConflictDetector service.
+    Shared fixtures for conflict tests.
     
-    Tests Requirements: 3.1, 3.2, 3.4
+    Meeting 1 and Meeting 2 overlap and both include Alice; Meeting 3 does
+    not overlap either of them and only includes Bob.
     """
     
-    def setUp(self):
-        """Set up test data."""
-        self.now = timezone.now()
+    @classmethod
+    def setUpTestData(cls):
+        """Create the shared meeting graph once per class."""
+        cls.now = _FIXED_NOW
+        cls.t1h = cls.now + _H1
+        cls.t2h = cls.now + _H2
         
         # Create test meetings
-        self.meeting1 = Meeting.objects.create(
-            title='Meeting 1',
-            description='First meeting',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
-        )
-        
-        self.meeting2 = Meeting.objects.create(
-            title='Meeting 2',
-            description='Second meeting - overlaps with meeting 1',
-            start_time=self.now + timedelta(hours=1, minutes=30),
-            end_time=self.now + timedelta(hours=2, minutes=30)
-        )
-        
-        self.meeting3 = Meeting.objects.create(
-            title='Meeting 3',
-            description='Third meeting - no overlap',
-            start_time=self.now + timedelta(hours=3),
-            end_time=self.now + timedelta(hours=4)
-        )
+        cls.meeting1, cls.meeting2, cls.meeting3 = Meeting.objects.bulk_create([
+            Meeting(
+                title='Meeting 1',
+                description='First meeting',
+                start_time=cls.t1h,
+                end_time=cls.t2h
+            ),
+            Meeting(
+                title='Meeting 2',
+                description='Second meeting - overlaps with meeting 1',
+                start_time=cls.now + timedelta(hours=1, minutes=30),
+                end_time=cls.now + timedelta(hours=2, minutes=30)
+            ),
+            Meeting(
+                title='Meeting 3',
+                description='Third meeting - no overlap',
+                start_time=cls.now + _H3,
+                end_time=cls.now + _H4
+            ),
+        ])
         
         # Create participants
-        self.participant1 = Participant.objects.create(
-            meeting=self.meeting1,
-            email='alice@example.com',
-            name='Alice'
-        )
-        
-        self.participant2 = Participant.objects.create(
-            meeting=self.meeting2,
-            email='alice@example.com',
-            name='Alice'
-        )
-        
-        self.participant3 = Participant.objects.create(
-            meeting=self.meeting3,
-            email='bob@example.com',
-            name='Bob'
-        )
+        cls.participant1, cls.participant2, cls.participant3 = Participant.objects.bulk_create([
+            Participant(meeting=cls.meeting1, email='alice@example.com', name='Alice'),
+            Participant(meeting=cls.meeting2, email='alice@example.com', name='Alice'),
+            Participant(meeting=cls.meeting3, email='bob@example.com', name='Bob'),
+        ])
+        
+        # Serialized ids, as they appear in response payloads
+        cls.mid1, cls.mid2, cls.mid3 = (str(m.id) for m in (cls.meeting1, cls.meeting2, cls.meeting3))
+
+
+class ConflictDetectorTestCase(ConflictTestDataMixin, TestCase):
+    """
+    Test case for ConflictDetector service.
+    
+    Tests Requirements: 3.1, 3.2, 3.4
+    """
     
     def test_detect_time_overlap_with_overlap(self):
         """
         Test detecting overlap between two meetings that do overlap.
         Requirement: 3.2
         """
-        has_overlap = ConflictDetector.detect_time_overlap(self.meeting1, self.meeting2)
+        # Overlap detection is pure Python and must never hit the database
+        with self.assertNumQueries(0):
+            has_overlap = ConflictDetector.detect_time_overlap(self.meeting1, self.meeting2)
         self.assertTrue(has_overlap)
     
     def test_detect_time_overlap_without_overlap(self):
@@ -515,132 +907,36 @@ class ConflictDetectorTestCase(TestCase):
         Test detecting overlap between two meetings that don't overlap.
         Requirement: 3.2
         """
-        has_overlap = ConflictDetector.detect_time_overlap(self.meeting1, self.meeting3)
+        with self.assertNumQueries(0):
+            has_overlap = ConflictDetector.detect_time_overlap(self.meeting1, self.meeting3)
         self.assertFalse(has_overlap)
     
-    def test_detect_time_overlap_adjacent_meetings(self):
+    def test_get_all_conflicts_with_conflicts(self):
         """
-        Test that adjacent meetings (end time = start time) don't overlap.
-        Requirement: 3.2
+        Test getting all conflicts for all participants in a meeting.
+        Requirement: 3.4
         """
-        meeting_a = Meeting.objects.create(
-            title='Meeting A',
-            start_time=self.now + timedelta(hours=5),
-            end_time=self.now + timedelta(hours=6)
-        )
-        meeting_b = Meeting.objects.create(
-            title='Meeting B',
-            start_time=self.now + timedelta(hours=6),
-            end_time=self.now + timedelta(hours=7)
-        )
+        conflicts = ConflictDetector.get_all_conflicts(self.meeting1)
         
-        has_overlap = ConflictDetector.detect_time_overlap(meeting_a, meeting_b)
-        self.assertFalse(has_overlap)
+        # Alice should have conflicts (meeting2)
+        self.assertIn('alice@example.com', conflicts)
+        self.assertEqual(len(conflicts['alice@example.com']), 1)
+        self.assertEqual(conflicts['alice@example.com'][0]['id'], self.meeting2.id)
     
-    def test_detect_time_overlap_with_dict(self):
+    def test_get_all_conflicts_without_conflicts(self):
         """
-        Test overlap detection with dictionary inputs.
-        Requirement: 3.2
+        Test getting conflicts when no conflicts exist.
+        Requirement: 3.4
         """
-        meeting_dict1 = {
-            'start_time': self.now + timedelta(hours=1),
-            'end_time': self.now + timedelta(hours=2)
-        }
-        meeting_dict2 = {
-            'start_time': self.now + timedelta(hours=1, minutes=30),
-            'end_time': self.now + timedelta(hours=2, minutes=30)
-        }
+        conflicts = ConflictDetector.get_all_conflicts(self.meeting3)
         
-        has_overlap = ConflictDetector.detect_time_overlap(meeting_dict1, meeting_dict2)
-        self.assertTrue(has_overlap)
+        # Bob has no conflicts
+        self.assertEqual(len(conflicts), 0)
     
-    def test_check_participant_conflicts_with_conflicts(self):
+    def test_get_all_conflicts_multiple_participants(self):
         """
-        Test finding conflicts for a participant who has overlapping meetings.
-        Requirement: 3.1
-        """
-        # Alice is in both meeting1 and meeting2, which overlap
-        # Exclude meeting1 to check for conflicts with other meetings
-        conflicts = ConflictDetector.check_participant_conflicts(
-            'alice@example.com',
-            self.meeting1,
-            exclude_meeting_id=self.meeting1.id
-        )
-        
-        # Should find meeting2 as a conflict
-        self.assertEqual(conflicts.count(), 1)
-        self.assertIn(self.meeting2, conflicts)
-    
-    def test_check_participant_conflicts_without_conflicts(self):
-        """
-        Test finding conflicts for a participant with no overlapping meetings.
-        Requirement: 3.1
-        """
-        # Bob is only in meeting3, which doesn't overlap with anything
-        # Exclude meeting3 to check for conflicts with other meetings
-        conflicts = ConflictDetector.check_participant_conflicts(
-            'bob@example.com',
-            self.meeting3,
-            exclude_meeting_id=self.meeting3.id
-        )
-        
-        self.assertEqual(conflicts.count(), 0)
-    
-    def test_check_participant_conflicts_exclude_meeting(self):
-        """
-        Test that we can exclude a specific meeting from conflict check.
-        Requirement: 3.1
-        """
-        # Check conflicts for alice in meeting1, excluding meeting1 itself
-        conflicts = ConflictDetector.check_participant_conflicts(
-            'alice@example.com',
-            self.meeting1,
-            exclude_meeting_id=self.meeting1.id
-        )
-        
-        # Should still find meeting2 as a conflict
-        self.assertEqual(conflicts.count(), 1)
-        self.assertIn(self.meeting2, conflicts)
-    
-    def test_check_participant_conflicts_new_participant(self):
-        """
-        Test checking conflicts for a participant not yet in any meetings.
-        Requirement: 3.1
-        """
-        conflicts = ConflictDetector.check_participant_conflicts(
-            'charlie@example.com',
-            self.meeting1
-        )
-        
-        # Charlie has no meetings, so no conflicts
-        self.assertEqual(conflicts.count(), 0)
-    
-    def test_get_all_conflicts_with_conflicts(self):
-        """
-        Test getting all conflicts for all participants in a meeting.
-        Requirement: 3.4
-        """
-        conflicts = ConflictDetector.get_all_conflicts(self.meeting1)
-        
-        # Alice should have conflicts (meeting2)
-        self.assertIn('alice@example.com', conflicts)
-        self.assertEqual(len(conflicts['alice@example.com']), 1)
-        self.assertIn(self.meeting2, conflicts['alice@example.com'])
-    
-    def test_get_all_conflicts_without_conflicts(self):
-        """
-        Test getting conflicts when no conflicts exist.
-        Requirement: 3.4
-        """
-        conflicts = ConflictDetector.get_all_conflicts(self.meeting3)
-        
-        # Bob has no conflicts
-        self.assertEqual(len(conflicts), 0)
-    
-    def test_get_all_conflicts_multiple_participants(self):
-        """
-        Test getting conflicts for a meeting with multiple participants.
-        Requirement: 3.4
+        Test getting conflicts for a meeting with multiple participants.
+        Requirement: 3.4
         """
         # Create a meeting that overlaps with meeting1
         meeting_overlap = Meeting.objects.create(
@@ -662,7 +958,9 @@ class ConflictDetectorTestCase(TestCase):
             name='Bob'
         )
         
-        conflicts = ConflictDetector.get_all_conflicts(self.meeting1)
+        # One query for the emails, one for every participant's conflicts
+        with self.assertNumQueries(2):
+            conflicts = ConflictDetector.get_all_conflicts(self.meeting1)
         
         # Alice should have conflicts (meeting2)
         self.assertIn('alice@example.com', conflicts)
@@ -670,14 +968,50 @@ class ConflictDetectorTestCase(TestCase):
         # Bob should have conflicts (meeting_overlap)
         self.assertIn('bob@example.com', conflicts)
         self.assertEqual(len(conflicts['bob@example.com']), 1)
-        self.assertIn(meeting_overlap, conflicts['bob@example.com'])
+        self.assertEqual(conflicts['bob@example.com'][0]['id'], meeting_overlap.id)
+    
+    def test_get_all_conflicts_scales_with_participants(self):
+        """
+        Test that get_all_conflicts stays at two queries as participants grow.
+        Requirement: 3.4
+        """
+        for n_participants in (1, 10, 100):
+            with self.subTest(n_participants=n_participants):
+                meeting, overlapping = Meeting.objects.bulk_create([
+                    Meeting(
+                        title=f'Scaling {n_participants}',
+                        start_time=self.now + timedelta(days=n_participants),
+                        end_time=self.now + timedelta(days=n_participants, hours=1)
+                    ),
+                    Meeting(
+                        title=f'Scaling overlap {n_participants}',
+                        start_time=self.now + timedelta(days=n_participants, minutes=30),
+                        end_time=self.now + timedelta(days=n_participants, hours=2)
+                    ),
+                ])
+                Participant.objects.bulk_create([
+                    Participant(meeting=m, email=f'scale{i}@example.com', name=f'Scale {i}')
+                    for i in range(n_participants)
+                    for m in (meeting, overlapping)
+                ])
+                
+                with self.assertNumQueries(2):
+                    conflicts = ConflictDetector.get_all_conflicts(meeting)
+                
+                self.assertEqual(len(conflicts), n_participants)
+                self.assertTrue(all(
+                    [c['id'] for c in meeting_conflicts] == [overlapping.id]
+                    for meeting_conflicts in conflicts.values()
+                ))
     
     def test_has_conflicts_true(self):
         """
         Test has_conflicts returns True when conflicts exist.
         Requirement: 3.1
         """
-        has_conflicts = ConflictDetector.has_conflicts(self.meeting1)
+        # A single EXISTS with the participant emails as a subquery
+        with self.assertNumQueries(1):
+            has_conflicts = ConflictDetector.has_conflicts(self.meeting1)
         self.assertTrue(has_conflicts)
     
     def test_has_conflicts_false(self):
@@ -721,17 +1055,94 @@ class ConflictDetectorTestCase(TestCase):
         self.assertIn('alice@example.com', conflicts)
         self.assertGreater(len(conflicts['alice@example.com']), 0)
     
+    def test_find_overlaps(self):
+        """
+        Test the sweep-line overlap search over a set of meetings.
+        Requirement: 3.2
+        """
+        meeting_adjacent = Meeting.objects.create(
+            title='Adjacent Meeting',
+            start_time=self.now + timedelta(hours=2, minutes=30),
+            end_time=self.now + _H3
+        )
+
+        with self.assertNumQueries(0):
+            overlaps = ConflictDetector.find_overlaps(
+                [self.meeting3, meeting_adjacent, self.meeting2, self.meeting1]
+            )
+
+        # meeting1 and meeting2 overlap each other
+        self.assertEqual(overlaps[self.meeting1.id], [self.meeting2])
+        self.assertEqual(overlaps[self.meeting2.id], [self.meeting1])
+
+        # Adjacent meetings (end == start) do not overlap
+        self.assertNotIn(meeting_adjacent.id, overlaps)
+        self.assertNotIn(self.meeting3.id, overlaps)
+
+
+
+class ConflictOverlapPureTestCase(SimpleTestCase):
+    """
+    Test case for ConflictDetector.detect_time_overlap on unsaved data.
+    
+    SimpleTestCase forbids database access, so these tests also guarantee
+    that overlap detection stays a pure in-memory comparison.
+    
+    Tests Requirements: 3.2
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.now = _FIXED_NOW
+    
+    def test_detect_time_overlap_adjacent_meetings(self):
+        """
+        Test that adjacent meetings (end time = start time) don't overlap.
+        Requirement: 3.2
+        """
+        meeting_a = Meeting(
+            title='Meeting A',
+            start_time=self.now + timedelta(hours=5),
+            end_time=self.now + timedelta(hours=6)
+        )
+        meeting_b = Meeting(
+            title='Meeting B',
+            start_time=self.now + timedelta(hours=6),
+            end_time=self.now + timedelta(hours=7)
+        )
+        
+        has_overlap = ConflictDetector.detect_time_overlap(meeting_a, meeting_b)
+        self.assertFalse(has_overlap)
+    
+    def test_detect_time_overlap_with_dict(self):
+        """
+        Test overlap detection with dictionary inputs.
+        Requirement: 3.2
+        """
+        meeting_dict1 = {
+            'start_time': self.now + _H1,
+            'end_time': self.now + _H2
+        }
+        meeting_dict2 = {
+            'start_time': self.now + timedelta(hours=1, minutes=30),
+            'end_time': self.now + timedelta(hours=2, minutes=30)
+        }
+        
+        has_overlap = ConflictDetector.detect_time_overlap(meeting_dict1, meeting_dict2)
+        self.assertTrue(has_overlap)
+    
     def test_conflict_detection_same_start_different_end(self):
         """
         Test overlap detection for meetings with same start time but different end times.
         Requirement: 3.2
         """
-        meeting_a = Meeting.objects.create(
+        meeting_a = Meeting(
             title='Meeting A',
             start_time=self.now + timedelta(hours=20),
             end_time=self.now + timedelta(hours=21)
         )
-        meeting_b = Meeting.objects.create(
+        meeting_b = Meeting(
             title='Meeting B',
             start_time=self.now + timedelta(hours=20),
             end_time=self.now + timedelta(hours=22)
@@ -745,12 +1156,12 @@ class ConflictDetectorTestCase(TestCase):
         Test overlap detection when one meeting completely contains another.
         Requirement: 3.2
         """
-        meeting_outer = Meeting.objects.create(
+        meeting_outer = Meeting(
             title='Outer Meeting',
             start_time=self.now + timedelta(hours=30),
             end_time=self.now + timedelta(hours=33)
         )
-        meeting_inner = Meeting.objects.create(
+        meeting_inner = Meeting(
             title='Inner Meeting',
             start_time=self.now + timedelta(hours=31),
             end_time=self.now + timedelta(hours=32)
@@ -760,78 +1171,97 @@ class ConflictDetectorTestCase(TestCase):
         self.assertTrue(has_overlap)
 
 
-
-class ConflictEndpointTestCase(APITestCase):
+class ConflictEndpointTestCase(ConflictTestDataMixin, APITestCase):
     """
     Test case for the conflicts endpoint.
     
-    Tests the GET /api/meetings/{id}/conflicts/ endpoint.
+    Tests the GET /api/meetings/{id}/check-conflicts/ endpoint.
     """
     
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
-        self.base_url = '/api/meetings/'
-        self.now = timezone.now()
-        
-        # Create meetings
-        self.meeting1 = Meeting.objects.create(
-            title='Meeting 1',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
-        )
-        
-        self.meeting2 = Meeting.objects.create(
-            title='Meeting 2',
-            start_time=self.now + timedelta(hours=1, minutes=30),
-            end_time=self.now + timedelta(hours=2, minutes=30)
-        )
-        
-        # Add participants
-        Participant.objects.create(
-            meeting=self.meeting1,
-            email='alice@example.com',
-            name='Alice'
-        )
-        
-        Participant.objects.create(
-            meeting=self.meeting2,
-            email='alice@example.com',
-            name='Alice'
-        )
+    base_url = '/api/meetings/'
     
     def test_check_conflicts_endpoint_with_conflicts(self):
         """Test the conflicts endpoint when conflicts exist."""
-        response = self.client.get(f'{self.base_url}{self.meeting1.id}/check-conflicts/')
+        # meeting, participant emails, conflicts
+        with self.assertNumQueries(3):
+            response = self.client.get(f'{self.base_url}{self.meeting1.id}/check-conflicts/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('has_conflicts', response.data)
         self.assertIn('conflicts', response.data)
+        conflicts = response.data['conflicts']
         
         # Should have conflicts
         self.assertTrue(response.data['has_conflicts'])
-        self.assertIn('alice@example.com', response.data['conflicts'])
+        self.assertIn('alice@example.com', conflicts)
         
         # Check conflict details
-        alice_conflicts = response.data['conflicts']['alice@example.com']
+        alice_conflicts = conflicts['alice@example.com']
         self.assertEqual(len(alice_conflicts), 1)
-        self.assertEqual(alice_conflicts[0]['id'], str(self.meeting2.id))
+        self.assertEqual(alice_conflicts[0]['id'], self.mid2)
+    
+    def test_check_conflicts_endpoint_summary_only(self):
+        """Test that detail=0 answers with just the boolean from one EXISTS query."""
+        for meeting, expected in ((self.meeting1, True), (self.meeting3, False)):
+            with self.subTest(meeting=meeting.title):
+                # meeting, conflict EXISTS
+                with self.assertNumQueries(2):
+                    response = self.client.get(
+                        f'{self.base_url}{meeting.id}/check-conflicts/', {'detail': '0'}
+                    )
+                
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data, {'has_conflicts': expected})
+    
+    def test_check_conflicts_endpoint_query_count_constant(self):
+        """Test that the conflicts endpoint does not query per participant."""
+        # Twenty more people booked into both overlapping meetings
+        Participant.objects.bulk_create([
+            Participant(meeting=meeting, email=f'user{i}@example.com', name=f'User {i}')
+            for i in range(20)
+            for meeting in (self.meeting1, self.meeting2)
+        ])
+        
+        with self.assertNumQueries(3):
+            response = self.client.get(f'{self.base_url}{self.meeting1.id}/check-conflicts/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['conflicts']), 21)
+    
+    def test_check_conflicts_bulk_matches_single_checks(self):
+        """Test that the bulk check reports each meeting's conflicts in three queries."""
+        meetings = (self.meeting1, self.meeting2, self.meeting3)
+        
+        # meetings, their participants, overlapping participations
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                f'{self.base_url}check-conflicts-bulk/',
+                {'meeting_ids': [str(m.id) for m in meetings] + [str(uuid.uuid4())]},
+                format='json'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {str(m.id) for m in meetings})
+        self.assertIn('alice@example.com', response.data[str(self.meeting1.id)])
+        for meeting in meetings:
+            single = self.client.get(f'{self.base_url}{meeting.id}/check-conflicts/')
+            self.assertEqual(response.data[str(meeting.id)], single.data['conflicts'])
+    
+    def test_check_conflicts_bulk_rejects_invalid_ids(self):
+        """Test that the bulk check validates the posted meeting IDs."""
+        for payload in ({}, {'meeting_ids': []}, {'meeting_ids': ['not-a-uuid']}):
+            with self.subTest(payload=payload):
+                with self.assertNumQueries(0):
+                    response = self.client.post(
+                        f'{self.base_url}check-conflicts-bulk/', payload, format='json'
+                    )
+                
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('meeting_ids', response.data)
     
     def test_check_conflicts_endpoint_without_conflicts(self):
         """Test the conflicts endpoint when no conflicts exist."""
-        meeting3 = Meeting.objects.create(
-            title='Meeting 3',
-            start_time=self.now + timedelta(hours=5),
-            end_time=self.now + timedelta(hours=6)
-        )
-        
-        Participant.objects.create(
-            meeting=meeting3,
-            email='bob@example.com',
-            name='Bob'
-        )
-        
-        response = self.client.get(f'{self.base_url}{meeting3.id}/check-conflicts/')
+        response = self.client.get(f'{self.base_url}{self.meeting3.id}/check-conflicts/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertFalse(response.data['has_conflicts'])
@@ -843,7 +1273,7 @@ class ConflictEndpointTestCase(APITestCase):
         response = self.client.get(f'{self.base_url}{fake_uuid}/check-conflicts/')
         
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertIn('error', response.json())
+        self.assertIn('error', response.data)
 
 
 
@@ -854,125 +1284,101 @@ class ParticipantQueryTestCase(APITestCase):
     Tests Requirements: 6.1, 6.2, 6.3, 6.4
     """
     
-    def setUp(self):
-        """Set up test client and sample data."""
-        self.client = APIClient()
-        self.now = timezone.now()
+    @classmethod
+    def setUpTestData(cls):
+        """Create sample data once for the whole class."""
+        cls.now = _FIXED_NOW
         
         # Create test meetings
-        self.meeting1 = Meeting.objects.create(
-            title='Meeting 1',
-            description='First meeting',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
-        )
-        
-        self.meeting2 = Meeting.objects.create(
-            title='Meeting 2',
-            description='Second meeting',
-            start_time=self.now + timedelta(hours=3),
-            end_time=self.now + timedelta(hours=4)
-        )
-        
-        self.meeting3 = Meeting.objects.create(
-            title='Meeting 3',
-            description='Third meeting',
-            start_time=self.now + timedelta(days=5),
-            end_time=self.now + timedelta(days=5, hours=1)
-        )
+        cls.meeting1, cls.meeting2, cls.meeting3 = Meeting.objects.bulk_create([
+            Meeting(
+                title='Meeting 1',
+                description='First meeting',
+                start_time=cls.now + _H1,
+                end_time=cls.now + _H2
+            ),
+            Meeting(
+                title='Meeting 2',
+                description='Second meeting',
+                start_time=cls.now + _H3,
+                end_time=cls.now + _H4
+            ),
+            Meeting(
+                title='Meeting 3',
+                description='Third meeting',
+                start_time=cls.now + _D5,
+                end_time=cls.now + timedelta(days=5, hours=1)
+            ),
+        ])
         
         # Create participants
-        Participant.objects.create(
-            meeting=self.meeting1,
-            email='alice@example.com',
-            name='Alice'
-        )
+        Participant.objects.bulk_create([
+            Participant(meeting=cls.meeting1, email='alice@example.com', name='Alice'),
+            Participant(meeting=cls.meeting2, email='alice@example.com', name='Alice'),
+            Participant(meeting=cls.meeting3, email='alice@example.com', name='Alice'),
+            Participant(meeting=cls.meeting2, email='bob@example.com', name='Bob'),
+        ])
         
-        Participant.objects.create(
-            meeting=self.meeting2,
-            email='alice@example.com',
-            name='Alice'
-        )
+        # Serialized ids, as they appear in response payloads
+        cls.mid1, cls.mid2, cls.mid3 = (str(m.id) for m in (cls.meeting1, cls.meeting2, cls.meeting3))
         
-        Participant.objects.create(
-            meeting=self.meeting3,
-            email='alice@example.com',
-            name='Alice'
-        )
-        
-        Participant.objects.create(
-            meeting=self.meeting2,
-            email='bob@example.com',
-            name='Bob'
-        )
+        # Endpoint URLs used across tests
+        cls.alice_meetings_url = reverse('participant-meetings', kwargs={'email': 'alice@example.com'})
+        cls.alice_conflicts_url = reverse('participant-conflicts', kwargs={'email': 'alice@example.com'})
+        cls.bob_conflicts_url = reverse('participant-conflicts', kwargs={'email': 'bob@example.com'})
     
     def test_get_participant_meetings(self):
         """
         Test getting all meetings for a participant.
         Requirement: 6.1
         """
-        from urllib.parse import quote
-        response = self.client.get(f'/api/participants/{quote("alice@example.com")}/meetings/')
+        # One query for the meetings, one for all of their participants
+        with self.assertNumQueries(2):
+            response = self.client.get(self.alice_meetings_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 3)
         
         # Verify all meetings are returned
         meeting_ids = [m['id'] for m in response.data]
-        self.assertIn(str(self.meeting1.id), meeting_ids)
-        self.assertIn(str(self.meeting2.id), meeting_ids)
-        self.assertIn(str(self.meeting3.id), meeting_ids)
+        self.assertIn(self.mid1, meeting_ids)
+        self.assertIn(self.mid2, meeting_ids)
+        self.assertIn(self.mid3, meeting_ids)
     
     def test_participant_meetings_chronological_order(self):
         """
         Test that participant meetings are ordered chronologically.
         Requirement: 6.2
         """
-        from urllib.parse import quote
-        response = self.client.get(f'/api/participants/{quote("alice@example.com")}/meetings/')
+        response = self.client.get(self.alice_meetings_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Verify chronological ordering
-        for i in range(len(response.data) - 1):
-            current_start = datetime.fromisoformat(response.data[i]['start_time'].replace('Z', '+00:00'))
-            next_start = datetime.fromisoformat(response.data[i + 1]['start_time'].replace('Z', '+00:00'))
+        # Verify chronological ordering. The serializer renders every time
+        # in UTC with a trailing 'Z', so the ISO strings sort chronologically
+        starts = [m['start_time'] for m in response.data]
+        for current_start, next_start in zip(starts, starts[1:]):
             self.assertLessEqual(current_start, next_start)
     
-    def test_participant_no_meetings(self):
-        """
-        Test getting meetings for a participant with no meetings.
-        Requirement: 6.3
-        """
-        from urllib.parse import quote
-        response = self.client.get(f'/api/participants/{quote("charlie@example.com")}/meetings/')
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
-    
-    def test_participant_meetings_with_date_filter(self):
+    def test_participant_meetings_with_many_participants(self):
         """
-        Test filtering participant meetings by date range.
-        Requirement: 6.4
+        Test participant lookup among many other participants.
+        Requirements: 6.1, 6.2
         """
-        from urllib.parse import quote
+        meetings = (self.meeting1, self.meeting2, self.meeting3)
+        Participant.objects.bulk_create([
+            Participant(meeting=meetings[i % 3], email=f'load{i}@example.com', name=f'Load {i}')
+            for i in range(200)
+        ])
         
-        # Filter for meetings in the next 2 days
-        start_date = self.now.replace(microsecond=0).isoformat()
-        end_date = (self.now + timedelta(days=2)).replace(microsecond=0).isoformat()
-        
-        response = self.client.get(
-            f'/api/participants/{quote("alice@example.com")}/meetings/?start_date={quote(start_date)}&end_date={quote(end_date)}'
-        )
+        with self.assertNumQueries(2):
+            response = self.client.get(self.alice_meetings_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should only get meeting1 and meeting2, not meeting3 (which is 5 days away)
-        self.assertEqual(len(response.data), 2)
-        
-        meeting_ids = [m['id'] for m in response.data]
-        self.assertIn(str(self.meeting1.id), meeting_ids)
-        self.assertIn(str(self.meeting2.id), meeting_ids)
-        self.assertNotIn(str(self.meeting3.id), meeting_ids)
+        self.assertEqual(
+            [m['id'] for m in response.data],
+            [str(m.id) for m in meetings]
+        )
     
     def test_check_participant_conflicts(self):
         """
@@ -993,8 +1399,9 @@ class ParticipantQueryTestCase(APITestCase):
             name='Alice'
         )
         
-        from urllib.parse import quote
-        response = self.client.get(f'/api/participants/{quote("alice@example.com")}/conflicts/')
+        # One query for the schedule, one for all of its participants
+        with self.assertNumQueries(2):
+            response = self.client.get(self.alice_conflicts_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('has_conflicts', response.data)
@@ -1004,13 +1411,42 @@ class ParticipantQueryTestCase(APITestCase):
         # Should have at least one conflict
         self.assertGreater(len(response.data['conflicts']), 0)
     
+    def test_participant_conflicts_scales_linearly(self):
+        """
+        Test participant conflicts keep a fixed query count for a large schedule.
+        Requirement: 6.1
+        """
+        # 500 back-to-back half-hour meetings, each overlapping only the next one
+        meetings = Meeting.objects.bulk_create([
+            Meeting(
+                title=f'Block {i}',
+                start_time=self.now + _D5 + timedelta(minutes=20 * i),
+                end_time=self.now + _D5 + timedelta(minutes=20 * i + 30)
+            )
+            for i in range(500)
+        ])
+        Participant.objects.bulk_create([
+            Participant(meeting=meeting, email='carol@example.com', name='Carol')
+            for meeting in meetings
+        ])
+        
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse('participant-conflicts', kwargs={'email': 'carol@example.com'})
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        conflicts = response.data['conflicts']
+        self.assertEqual(len(conflicts), 500)
+        self.assertEqual(len(conflicts[0]['conflicting_with']), 1)
+        self.assertEqual(len(conflicts[1]['conflicting_with']), 2)
+    
     def test_participant_no_conflicts(self):
         """
         Test checking conflicts for a participant with no conflicts.
         Requirement: 6.1
         """
-        from urllib.parse import quote
-        response = self.client.get(f'/api/participants/{quote("bob@example.com")}/conflicts/')
+        response = self.client.get(self.bob_conflicts_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertFalse(response.data['has_conflicts'])
@@ -1046,71 +1482,92 @@ class ParticipantQueryTestCase(APITestCase):
             name='Alice'
         )
         
-        from urllib.parse import quote
-        response = self.client.get(f'/api/participants/{quote("alice@example.com")}/conflicts/')
+        response = self.client.get(self.alice_conflicts_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Verify conflicts are in chronological order
-        if len(response.data['conflicts']) > 1:
-            for i in range(len(response.data['conflicts']) - 1):
-                current_start = datetime.fromisoformat(
-                    response.data['conflicts'][i]['meeting']['start_time'].replace('Z', '+00:00')
-                )
-                next_start = datetime.fromisoformat(
-                    response.data['conflicts'][i + 1]['meeting']['start_time'].replace('Z', '+00:00')
-                )
-                self.assertLessEqual(current_start, next_start)
+        # Verify conflicts are in chronological order (UTC ISO strings sort
+        # chronologically)
+        starts = [c['meeting']['start_time'] for c in response.data['conflicts']]
+        for current_start, next_start in zip(starts, starts[1:]):
+            self.assertLessEqual(current_start, next_start)
     
-    def test_participant_conflicts_with_date_filter(self):
+    def test_participant_date_filters(self):
         """
-        Test filtering participant conflicts by date range.
+        Test filtering participant meetings and conflicts by date range.
         Requirement: 6.4
         """
-        # Create overlapping meetings at different times
-        meeting_overlap_near = Meeting.objects.create(
-            title='Near Overlap',
-            start_time=self.now + timedelta(hours=1, minutes=30),
-            end_time=self.now + timedelta(hours=2, minutes=30)
-        )
-        
-        meeting_overlap_far = Meeting.objects.create(
-            title='Far Overlap',
-            start_time=self.now + timedelta(days=5, minutes=30),
-            end_time=self.now + timedelta(days=5, hours=1, minutes=30)
-        )
-        
-        Participant.objects.create(
-            meeting=meeting_overlap_near,
-            email='alice@example.com',
-            name='Alice'
-        )
-        
-        Participant.objects.create(
-            meeting=meeting_overlap_far,
-            email='alice@example.com',
-            name='Alice'
-        )
-        
-        from urllib.parse import quote
-        
-        # Filter for conflicts in the next 2 days
-        start_date = self.now.replace(microsecond=0).isoformat()
-        end_date = (self.now + timedelta(days=2)).replace(microsecond=0).isoformat()
+        # Overlapping meetings: one inside the filtered window, one outside
+        meeting_overlap_near, meeting_overlap_far = Meeting.objects.bulk_create([
+            Meeting(
+                title='Near Overlap',
+                start_time=self.now + timedelta(hours=1, minutes=30),
+                end_time=self.now + timedelta(hours=2, minutes=30)
+            ),
+            Meeting(
+                title='Far Overlap',
+                start_time=self.now + timedelta(days=5, minutes=30),
+                end_time=self.now + timedelta(days=5, hours=1, minutes=30)
+            ),
+        ])
+        Participant.objects.bulk_create([
+            Participant(meeting=meeting_overlap_near, email='alice@example.com', name='Alice'),
+            Participant(meeting=meeting_overlap_far, email='alice@example.com', name='Alice'),
+        ])
+        near_id = str(meeting_overlap_near.id)
+        
+        # Filter for the next 2 days; meeting3 and the far overlap (day 5) fall outside
+        params = {
+            'start_date': self.now.replace(microsecond=0).isoformat(),
+            'end_date': (self.now + _D2).replace(microsecond=0).isoformat(),
+        }
         
-        response = self.client.get(
-            f'/api/participants/{quote("alice@example.com")}/conflicts/?start_date={quote(start_date)}&end_date={quote(end_date)}'
+        cases = (
+            (self.alice_meetings_url, lambda data: data, {self.mid1, self.mid2, near_id}),
+            (self.alice_conflicts_url, lambda data: [c['meeting'] for c in data['conflicts']], {self.mid1, near_id}),
         )
+        for url, extract, expected_ids in cases:
+            with self.subTest(url=url):
+                response = self.client.get(url, params)
+                
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual({m['id'] for m in extract(response.data)}, expected_ids)
+
+
+class ParticipantEmptyTestCase(APITestCase):
+    """
+    Test case for Participant query endpoints with no stored data.
+    
+    These tests only read empty results or rejected input, so they skip the
+    meeting fixtures built by ParticipantQueryTestCase.
+    
+    Tests Requirements: 6.3
+    """
+    
+    def test_participant_no_meetings(self):
+        """
+        Test getting meetings for a participant with no meetings.
+        Requirement: 6.3
+        """
+        response = self.client.get(reverse('participant-meetings', kwargs={'email': 'charlie@example.com'}))
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 0)
+    
+    def test_participant_no_conflicts(self):
+        """
+        Test that a participant without conflicts is answered from one query.
+        Requirement: 6.3
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('participant-conflicts', kwargs={'email': 'charlie@example.com'}))
         
-        # Should only include conflicts from the near future, not the far future
-        # The far overlap (day 5) should be filtered out
-        for conflict in response.data['conflicts']:
-            meeting_start = datetime.fromisoformat(
-                conflict['meeting']['start_time'].replace('Z', '+00:00')
-            )
-            self.assertLess(meeting_start, datetime.fromisoformat(end_date))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {
+            'participant_email': 'charlie@example.com',
+            'has_conflicts': False,
+            'conflicts': []
+        })
     
     def test_participant_meetings_invalid_email(self):
         """
@@ -1121,141 +1578,152 @@ class ParticipantQueryTestCase(APITestCase):
         # Should handle gracefully
         self.assertIn(response.status_code, [status.HTTP_400_BAD_REQUEST, status.HTTP_404_NOT_FOUND])
     
+    def test_participant_endpoints_reject_malformed_email(self):
+        """
+        Test that malformed emails are rejected by URL resolution without a query.
+        """
+        for url in ('/api/participants/not-an-email/meetings/', '/api/participants/alice@example/conflicts/'):
+            with self.subTest(url=url):
+                with self.assertNumQueries(0):
+                    response = self.client.get(url)
+                
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+    
     def test_participant_meetings_invalid_date_format(self):
         """
         Test getting meetings with invalid date format.
         """
-        from urllib.parse import quote
         response = self.client.get(
-            f'/api/participants/{quote("alice@example.com")}/meetings/?start_date=invalid-date'
+            reverse('participant-meetings', kwargs={'email': 'alice@example.com'}),
+            {'start_date': 'invalid-date'}
         )
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('error', response.data)
 
 
+class ICSAssertionsMixin:
+    """
+    Shared assertions for ICS output.
+    """
+    
+    def _assert_valid_ics(self, ics_bytes, expected_title, expected_uid, expected_emails=()):
+        """
+        Parse ICS content once and check the calendar and its single event.
+        
+        Args:
+            ics_bytes (bytes or str): ICS file content, raw or already decoded
+            expected_title (str): Expected event SUMMARY
+            expected_uid: Expected event UID (usually the meeting id)
+            expected_emails (iterable): Emails expected among the attendees
+        
+        Returns:
+            Event: The parsed VEVENT, for any further checks
+        """
+        cal = Calendar.from_ical(ics_bytes)
+        self.assertEqual(cal.get('version'), '2.0')
+        
+        events = [component for component in cal.walk() if component.name == 'VEVENT']
+        self.assertEqual(len(events), 1)
+        event = events[0]
+        
+        self.assertEqual(str(event.get('summary')), expected_title)
+        self.assertEqual(str(event.get('uid')), str(expected_uid))
+        
+        attendees = event.get('attendee') or []
+        if not isinstance(attendees, list):
+            attendees = [attendees]
+        emails = {str(attendee).rsplit(':', 1)[-1].lower() for attendee in attendees}
+        self.assertEqual(emails, {email.lower() for email in expected_emails})
+        
+        return event
 
-class ICSGeneratorTestCase(TestCase):
+
+class ICSGeneratorTestCase(ICSAssertionsMixin, TestCase):
     """
     Test case for ICSGenerator service.
     
     Tests Requirements: 4.1, 4.2, 4.4, 4.5
     """
     
-    def setUp(self):
-        """Set up test data."""
-        self.now = timezone.now()
+    @classmethod
+    def setUpTestData(cls):
+        """Create sample data once for the whole class."""
+        cls.now = _FIXED_NOW
         
         # Create test meeting
-        self.meeting = Meeting.objects.create(
+        cls.meeting = Meeting.objects.create(
             title='Team Standup',
             description='Daily team standup meeting',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
+            start_time=cls.now + _H1,
+            end_time=cls.now + _H2
         )
         
         # Add participants
-        self.participant1 = Participant.objects.create(
-            meeting=self.meeting,
-            email='alice@example.com',
-            name='Alice Smith'
-        )
-        
-        self.participant2 = Participant.objects.create(
-            meeting=self.meeting,
-            email='bob@example.com',
-            name='Bob Johnson'
-        )
+        cls.participant1, cls.participant2 = Participant.objects.bulk_create([
+            Participant(meeting=cls.meeting, email='alice@example.com', name='Alice Smith'),
+            Participant(meeting=cls.meeting, email='bob@example.com', name='Bob Johnson'),
+        ])
     
-    def test_create_calendar_event(self):
+    def _meeting_ics(self, meeting):
+        """Return the complete ICS file streamed for a meeting."""
+        return b''.join(ICSGenerator.stream_meeting_ics(meeting))
+    
+    def test_event_properties(self):
         """
-        Test creating an iCalendar event from a Meeting object.
+        Test that a meeting's fields are written to its VEVENT.
         Requirement: 4.2
         """
-        from meeting.services import ICSGenerator
-        
-        event = ICSGenerator.create_calendar_event(self.meeting)
+        event = self._assert_valid_ics(
+            self._meeting_ics(self.meeting),
+            self.meeting.title,
+            self.meeting.id,
+            ['alice@example.com', 'bob@example.com']
+        )
         
-        # Verify event has required fields
-        self.assertIsNotNone(event.get('uid'))
-        self.assertEqual(str(event.get('uid')), str(self.meeting.id))
-        self.assertEqual(str(event.get('summary')), self.meeting.title)
         self.assertEqual(str(event.get('description')), self.meeting.description)
-        
-        # Verify times are present
-        self.assertIsNotNone(event.get('dtstart'))
-        self.assertIsNotNone(event.get('dtend'))
-        self.assertIsNotNone(event.get('dtstamp'))
+        self.assertEqual(event.decoded('dtstart'), self.meeting.start_time)
+        self.assertEqual(event.decoded('dtend'), self.meeting.end_time)
+        self.assertEqual(event.decoded('dtstamp'), self.meeting.created_at.replace(microsecond=0))
+        self.assertEqual(event.decoded('last-modified'), self.meeting.updated_at.replace(microsecond=0))
     
-    def test_create_calendar_event_without_description(self):
+    def test_event_without_description(self):
         """
-        Test creating an event for a meeting without description.
+        Test that a meeting without description has no DESCRIPTION property.
         Requirement: 4.2
         """
-        from meeting.services import ICSGenerator
-        
         meeting_no_desc = Meeting.objects.create(
             title='Quick Meeting',
             description='',
-            start_time=self.now + timedelta(hours=3),
-            end_time=self.now + timedelta(hours=4)
+            start_time=self.now + _H3,
+            end_time=self.now + _H4
         )
         
-        event = ICSGenerator.create_calendar_event(meeting_no_desc)
-        
-        self.assertEqual(str(event.get('summary')), 'Quick Meeting')
-        # Description should be empty or not present
-        desc = event.get('description')
-        self.assertTrue(desc is None or str(desc) == '')
-    
-    def test_format_attendees(self):
-        """
-        Test formatting participants as ATTENDEE fields per RFC 5545.
-        Requirement: 4.4
-        """
-        from meeting.services import ICSGenerator
-        
-        participants = self.meeting.participants.all()
-        attendees = ICSGenerator.format_attendees(participants)
-        
-        # Should have 2 attendees
-        self.assertEqual(len(attendees), 2)
-        
-        # Check first attendee
-        attendee1 = attendees[0]
-        self.assertIn('MAILTO:', str(attendee1))
-        self.assertIn('alice@example.com', str(attendee1))
-        self.assertEqual(attendee1.params['cn'], 'Alice Smith')
-        self.assertEqual(attendee1.params['role'], 'REQ-PARTICIPANT')
-        self.assertEqual(attendee1.params['rsvp'], 'TRUE')
+        event = self._assert_valid_ics(
+            self._meeting_ics(meeting_no_desc), 'Quick Meeting', meeting_no_desc.id
+        )
+        self.assertIsNone(event.get('description'))
     
-    def test_format_attendees_empty_list(self):
+    def test_attendee_properties(self):
         """
-        Test formatting attendees with empty participant list.
+        Test that participants are written as ATTENDEE fields per RFC 5545.
         Requirement: 4.4
         """
-        from meeting.services import ICSGenerator
+        event = Calendar.from_ical(self._meeting_ics(self.meeting)).walk('VEVENT')[0]
+        attendees = {str(attendee): attendee.params for attendee in event.get('attendee')}
         
-        attendees = ICSGenerator.format_attendees([])
-        self.assertEqual(len(attendees), 0)
+        self.assertEqual(set(attendees), {'MAILTO:alice@example.com', 'MAILTO:bob@example.com'})
+        params = attendees['MAILTO:alice@example.com']
+        self.assertEqual(params['cn'], 'Alice Smith')
+        self.assertEqual(params['role'], 'REQ-PARTICIPANT')
+        self.assertEqual(params['rsvp'], 'TRUE')
     
     def test_generate_ics(self):
         """
         Test generating complete ICS file content.
         Requirements: 4.1, 4.2, 4.4, 4.5
         """
-        from meeting.services import ICSGenerator
-        
-        ics_content = ICSGenerator.generate_ics(self.meeting)
-        
-        # Should return bytes
-        self.assertIsInstance(ics_content, bytes)
-        
-        # Convert to string for verification
-        ics_str = ics_content.decode('utf-8')
-        
-        # Remove line folding (RFC 5545 allows lines to be split with \r\n followed by space)
-        ics_str_unfolded = ics_str.replace('\r\n ', '').replace('\n ', '')
+        ics_str = self._meeting_ics(self.meeting).decode('utf-8')
         
         # Verify ICS structure
         self.assertIn('BEGIN:VCALENDAR', ics_str)
@@ -1268,24 +1736,22 @@ class ICSGeneratorTestCase(TestCase):
         self.assertIn('VERSION:2.0', ics_str)
         self.assertIn('CALSCALE:GREGORIAN', ics_str)
         
-        # Verify meeting details
-        self.assertIn('SUMMARY:Team Standup', ics_str)
-        self.assertIn('DESCRIPTION:Daily team standup meeting', ics_str)
-        
-        # Verify attendees (check in unfolded string due to line wrapping)
-        self.assertIn('ATTENDEE', ics_str)
-        self.assertIn('alice@example.com', ics_str_unfolded)
-        self.assertIn('bob@example.com', ics_str_unfolded)
-        self.assertIn('Alice Smith', ics_str)
-        self.assertIn('Bob Johnson', ics_str)
+        # Verify meeting details and attendees against the parsed event
+        event = self._assert_valid_ics(
+            ics_str,
+            'Team Standup',
+            self.meeting.id,
+            {'alice@example.com', 'bob@example.com'}
+        )
+        self.assertEqual(str(event.get('description')), 'Daily team standup meeting')
+        names = {attendee.params.get('CN') for attendee in event.get('attendee')}
+        self.assertEqual(names, {'Alice Smith', 'Bob Johnson'})
     
     def test_generate_ics_without_participants(self):
         """
         Test generating ICS for a meeting without participants.
         Requirement: 4.1
         """
-        from meeting.services import ICSGenerator
-        
         meeting_no_participants = Meeting.objects.create(
             title='Solo Meeting',
             description='Meeting without participants',
@@ -1293,129 +1759,179 @@ class ICSGeneratorTestCase(TestCase):
             end_time=self.now + timedelta(hours=6)
         )
         
-        ics_content = ICSGenerator.generate_ics(meeting_no_participants)
-        ics_str = ics_content.decode('utf-8')
+        ics_content = self._meeting_ics(meeting_no_participants)
         
-        # Should still have valid ICS structure
-        self.assertIn('BEGIN:VCALENDAR', ics_str)
-        self.assertIn('BEGIN:VEVENT', ics_str)
-        self.assertIn('SUMMARY:Solo Meeting', ics_str)
+        # Should still have valid ICS structure, with no ATTENDEE lines
+        self.assertIn(b'SUMMARY:Solo Meeting', ics_content)
+        self._assert_valid_ics(ics_content, 'Solo Meeting', meeting_no_participants.id)
     
     def test_ics_timezone_handling(self):
         """
-        Test that ICS generation handles timezones correctly (UTC).
+        Test that ICS times are written in UTC.
         Requirement: 4.5
         """
-        from meeting.services import ICSGenerator
-        
-        ics_content = ICSGenerator.generate_ics(self.meeting)
-        ics_str = ics_content.decode('utf-8')
+        ics_str = self._meeting_ics(self.meeting).decode('utf-8')
         
-        # Should contain UTC timezone indicators
-        # ICS format uses Z suffix for UTC times or explicit timezone
-        self.assertTrue('Z' in ics_str or 'UTC' in ics_str or 'TZID' in ics_str)
+        self.assertIn(f"DTSTART:{self.meeting.start_time.strftime('%Y%m%dT%H%M%SZ')}", ics_str)
+        self.assertIn(f"DTEND:{self.meeting.end_time.strftime('%Y%m%dT%H%M%SZ')}", ics_str)
     
-    def test_ics_round_trip_parsing(self):
+    def test_ics_special_characters(self):
         """
-        Test that generated ICS can be parsed by icalendar library.
+        Test ICS generation with special characters in title and description.
         Requirement: 4.5 - RFC 5545 compliance
         """
-        from meeting.services import ICSGenerator
-        from icalendar import Calendar
-        
-        ics_content = ICSGenerator.generate_ics(self.meeting)
-        
-        # Parse the generated ICS
-        cal = Calendar.from_ical(ics_content)
+        meeting_special = Meeting.objects.create(
+            title='Meeting: Q&A Session (Important!)',
+            description='Discussion about "Project X" & next steps; review @mentions',
+            start_time=self.now + timedelta(hours=7),
+            end_time=self.now + timedelta(hours=8)
+        )
         
-        # Verify calendar properties
-        self.assertEqual(cal.get('version'), '2.0')
+        # Should be parseable, with the special characters round-tripping
+        event = self._assert_valid_ics(
+            self._meeting_ics(meeting_special), meeting_special.title, meeting_special.id
+        )
+        self.assertEqual(str(event.get('description')), meeting_special.description)
+    
+    def test_ics_folding_and_escaping(self):
+        """
+        Test that long, non-ASCII and escaped values are folded and round-trip.
+        Requirements: 4.2, 4.4, 4.5
+        """
+        meeting = Meeting.objects.create(
+            title='Réunion: Q&A, planning; review',
+            description='Line one\nLine two with a much longer sentence ' * 4,
+            start_time=self.now + timedelta(hours=7),
+            end_time=self.now + timedelta(hours=8)
+        )
+        Participant.objects.create(meeting=meeting, email='alice@example.com', name='Smith, Alice')
         
-        # Get the event
-        events = [component for component in cal.walk() if component.name == 'VEVENT']
-        self.assertEqual(len(events), 1)
+        ics_content = self._meeting_ics(meeting)
         
-        event = events[0]
+        # Every physical line must respect the 75-octet limit
+        for line in ics_content.split(b'\r\n'):
+            self.assertLessEqual(len(line), 75)
         
-        # Verify event properties
-        self.assertEqual(str(event.get('summary')), self.meeting.title)
-        self.assertEqual(str(event.get('description')), self.meeting.description)
-        self.assertEqual(str(event.get('uid')), str(self.meeting.id))
+        event = self._assert_valid_ics(ics_content, meeting.title, meeting.id, ['alice@example.com'])
+        self.assertEqual(str(event.get('description')), meeting.description)
+        self.assertEqual(event.get('attendee').params['cn'], 'Smith, Alice')
+    
+    def test_prefetch_attendees_keeps_other_lookups(self):
+        """
+        Test that prefetch_attendees replaces only the participants prefetch.
+        Requirement: 4.4
+        """
+        queryset = Meeting.objects.prefetch_related(
+            'participants',
+            Prefetch('participants', to_attr='all_participants'),
+        )
+
+        # One query for meetings, then one per participants prefetch
+        with self.assertNumQueries(3):
+            meeting = ICSGenerator.prefetch_attendees(queryset).get(pk=self.meeting.pk)
+            self.assertEqual(len(meeting.all_participants), 2)
+            self.assertEqual(
+                {p.email for p in meeting.participants.all()},
+                {'alice@example.com', 'bob@example.com'}
+            )
+
+    def test_stream_meeting_ics_buffers_attendees(self):
+        """
+        Test that streamed ICS batches attendee lines and matches the calendar export.
+        Requirements: 4.1, 4.4
+        """
+        chunks = list(ICSGenerator.stream_meeting_ics(self.meeting, chunk_size=1))
         
-        # Verify attendees
-        attendees = event.get('attendee')
-        if not isinstance(attendees, list):
-            attendees = [attendees] if attendees else []
+        # Header and first attendee, second attendee, then the closing lines
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(b''.join(chunks), self._meeting_ics(self.meeting))
+        self.assertEqual(len(list(ICSGenerator.stream_meeting_ics(self.meeting))), 1)
         
-        self.assertEqual(len(attendees), 2)
+        # The single-meeting and full-calendar exports write the same bytes
+        self.assertEqual(
+            b''.join(ICSGenerator.stream_ics(Meeting.objects.filter(pk=self.meeting.pk))),
+            self._meeting_ics(self.meeting)
+        )
     
-    def test_ics_special_characters(self):
+    def test_attendee_name_cannot_inject_content_lines(self):
         """
-        Test ICS generation with special characters in title and description.
+        Test that line breaks in a participant name are escaped, not written out.
         Requirement: 4.5 - RFC 5545 compliance
         """
-        from meeting.services import ICSGenerator
-        
-        meeting_special = Meeting.objects.create(
-            title='Meeting: Q&A Session (Important!)',
-            description='Discussion about "Project X" & next steps; review @mentions',
+        meeting = Meeting.objects.create(
+            title='Injection',
             start_time=self.now + timedelta(hours=7),
             end_time=self.now + timedelta(hours=8)
         )
+        Participant.objects.create(
+            meeting=meeting,
+            email='eve@example.com',
+            name='Eve\r\nBEGIN:VALARM\r\nACTION:DISPLAY\n"^'
+        )
         
-        ics_content = ICSGenerator.generate_ics(meeting_special)
+        ics_content = self._meeting_ics(meeting)
         
-        # Should not raise exception
-        self.assertIsInstance(ics_content, bytes)
+        lines = _UNFOLD_RE.sub('', ics_content.decode('utf-8')).split('\r\n')
+        self.assertNotIn('BEGIN:VALARM', lines)
+        self.assertNotIn('ACTION:DISPLAY', lines)
         
-        # Should be parseable
-        from icalendar import Calendar
         cal = Calendar.from_ical(ics_content)
-        events = [component for component in cal.walk() if component.name == 'VEVENT']
-        self.assertEqual(len(events), 1)
-
+        self.assertEqual(cal.walk('VALARM'), [])
+        event = self._assert_valid_ics(ics_content, meeting.title, meeting.id, ['eve@example.com'])
+        self.assertEqual(event.get('attendee').params['cn'], 'Eve\nBEGIN:VALARM\nACTION:DISPLAY\n"^')
 
 
-class ICSExportEndpointTestCase(APITestCase):
+class ICSExportEndpointTestCase(ICSAssertionsMixin, APITestCase):
     """
     Test case for ICS export endpoint.
     
     Tests Requirement: 4.1
     """
     
-    def setUp(self):
-        """Set up test client and sample data."""
-        self.client = APIClient()
-        self.base_url = '/api/meetings/'
-        self.now = timezone.now()
-        
-        # Create test meeting
-        self.meeting = Meeting.objects.create(
-            title='Team Standup',
-            description='Daily team standup meeting',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
-        )
+    base_url = '/api/meetings/'
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create sample data once for the whole class."""
+        cls.now = _FIXED_NOW
+        
+        # Create test meetings: the main one, one with special characters in
+        # its title, and one without participants
+        cls.meeting, cls.meeting_special, cls.meeting_solo = Meeting.objects.bulk_create([
+            Meeting(
+                title='Team Standup',
+                description='Daily standup meeting',
+                start_time=cls.now + _H1,
+                end_time=cls.now + _H2
+            ),
+            Meeting(
+                title='Meeting: Q&A / Review (Important!)',
+                description='Special characters test',
+                start_time=cls.now + _H3,
+                end_time=cls.now + _H4
+            ),
+            Meeting(
+                title='Solo Meeting',
+                description='No participants',
+                start_time=cls.now + timedelta(hours=5),
+                end_time=cls.now + timedelta(hours=6)
+            ),
+        ])
         
         # Add participants
-        Participant.objects.create(
-            meeting=self.meeting,
-            email='alice@example.com',
-            name='Alice Smith'
-        )
+        Participant.objects.bulk_create([
+            Participant(meeting=cls.meeting, email='alice@example.com', name='Alice Smith'),
+            Participant(meeting=cls.meeting, email='bob@example.com', name='Bob Johnson'),
+        ])
         
-        Participant.objects.create(
-            meeting=self.meeting,
-            email='bob@example.com',
-            name='Bob Johnson'
-        )
+        cls.export_url = f'/api/meetings/{cls.meeting.id}/export/'
     
     def test_export_meeting_as_ics(self):
         """
         Test exporting a meeting as ICS file.
         Requirement: 4.1
         """
-        response = self.client.get(f'{self.base_url}{self.meeting.id}/export/')
+        response = self.client.get(self.export_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
@@ -1427,261 +1943,153 @@ class ICSExportEndpointTestCase(APITestCase):
         self.assertIn('attachment', response['Content-Disposition'])
         self.assertIn('.ics', response['Content-Disposition'])
     
-    def test_export_ics_content_structure(self):
+    def test_export_ics_content(self):
         """
-        Test that exported ICS has proper structure.
+        Test that exported ICS content is valid.
         Requirement: 4.1
         """
-        response = self.client.get(f'{self.base_url}{self.meeting.id}/export/')
+        response = self.client.get(self.export_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Get content
-        ics_content = response.content.decode('utf-8')
-        
-        # Verify ICS structure
-        self.assertIn('BEGIN:VCALENDAR', ics_content)
-        self.assertIn('END:VCALENDAR', ics_content)
-        self.assertIn('BEGIN:VEVENT', ics_content)
-        self.assertIn('END:VEVENT', ics_content)
-        
-        # Verify meeting details
-        self.assertIn('SUMMARY:Team Standup', ics_content)
-        self.assertIn('DESCRIPTION:Daily team standup meeting', ics_content)
+        event = self._assert_valid_ics(
+            b''.join(response.streaming_content),
+            'Team Standup',
+            self.meeting.id,
+            ['alice@example.com', 'bob@example.com']
+        )
+        self.assertEqual(str(event.get('description')), 'Daily standup meeting')
     
-    def test_export_ics_includes_participants(self):
+    def test_export_ics_parseable(self):
         """
-        Test that exported ICS includes participant information.
+        Test that exported ICS can be parsed by icalendar library.
         Requirement: 4.1
         """
-        response = self.client.get(f'{self.base_url}{self.meeting.id}/export/')
+        response = self.client.get(self.export_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Get content and unfold lines
-        ics_content = response.content.decode('utf-8')
-        ics_unfolded = ics_content.replace('\r\n ', '').replace('\n ', '')
-        
-        # Verify attendees are included
-        self.assertIn('ATTENDEE', ics_content)
-        self.assertIn('alice@example.com', ics_unfolded)
-        self.assertIn('bob@example.com', ics_unfolded)
-    
-    def test_export_nonexistent_meeting(self):
-        """
-        Test exporting a meeting that doesn't exist.
-        Requirement: 4.1
-        """
-        fake_uuid = '00000000-0000-0000-0000-000000000000'
-        response = self.client.get(f'{self.base_url}{fake_uuid}/export/')
-        
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertIn('error', response.json())
-    
-    def test_export_filename_sanitization(self):
-        """
-        Test that filename is properly sanitized.
-        Requirement: 4.1
-        """
-        # Create meeting with special characters in title
-        meeting_special = Meeting.objects.create(
-            title='Meeting: Q&A (Important!)',
-            description='Test meeting',
-            start_time=self.now + timedelta(hours=3),
-            end_time=self.now + timedelta(hours=4)
+        self._assert_valid_ics(
+            b''.join(response.streaming_content),
+            self.meeting.title,
+            self.meeting.id,
+            ['alice@example.com', 'bob@example.com']
         )
-        
-        response = self.client.get(f'{self.base_url}{meeting_special.id}/export/')
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Verify filename is sanitized (no special characters except _ - .)
-        content_disposition = response['Content-Disposition']
-        self.assertIn('.ics', content_disposition)
-        # Should not contain special characters like : & ( ) !
-        filename_part = content_disposition.split('filename=')[1].strip('"')
-        self.assertNotIn(':', filename_part)
-        self.assertNotIn('&', filename_part)
-        self.assertNotIn('(', filename_part)
-        self.assertNotIn(')', filename_part)
-        self.assertNotIn('!', filename_part)
     
-    def test_export_meeting_without_participants(self):
+    def test_export_constant_queries_vs_participant_count(self):
         """
-        Test exporting a meeting without participants.
-        Requirement: 4.1
+        Test that export cost does not grow with the number of attendees.
+        Requirements: 4.1, 4.4
         """
-        meeting_no_participants = Meeting.objects.create(
-            title='Solo Meeting',
-            description='Meeting without participants',
-            start_time=self.now + timedelta(hours=5),
-            end_time=self.now + timedelta(hours=6)
-        )
+        Participant.objects.bulk_create([
+            Participant(meeting=self.meeting, email=f'guest{i}@example.com', name=f'Guest {i}')
+            for i in range(50)
+        ])
         
-        response = self.client.get(f'{self.base_url}{meeting_no_participants.id}/export/')
+        # One query for the meeting, one to stream its participants
+        with self.assertNumQueries(2):
+            response = self.client.get(self.export_url)
+            ics_content = b''.join(response.streaming_content)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response['Content-Type'], 'text/calendar; charset=utf-8')
-        
-        # Should still have valid ICS structure
-        ics_content = response.content.decode('utf-8')
-        self.assertIn('BEGIN:VCALENDAR', ics_content)
-        self.assertIn('SUMMARY:Solo Meeting', ics_content)
+        events = [c for c in Calendar.from_ical(ics_content).walk() if c.name == 'VEVENT']
+        self.assertEqual(len(events[0].get('attendee')), 52)
     
-    def test_export_ics_parseable(self):
+    def test_export_all_meetings_streams_calendar(self):
         """
-        Test that exported ICS can be parsed by icalendar library.
+        Test exporting every meeting as one streamed ICS file.
         Requirement: 4.1
         """
-        from icalendar import Calendar
+        Meeting.objects.create(
+            title='Retro',
+            start_time=self.now + _D1,
+            end_time=self.now + timedelta(days=1, hours=1)
+        )
         
-        response = self.client.get(f'{self.base_url}{self.meeting.id}/export/')
+        response = self.client.get(f'{self.base_url}export/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertIn('text/calendar', response['Content-Type'])
+        self.assertIn('meetings.ics', response['Content-Disposition'])
         
-        # Parse the ICS content
-        cal = Calendar.from_ical(response.content)
-        
-        # Verify it's a valid calendar
-        self.assertEqual(cal.get('version'), '2.0')
-        
-        # Get events
+        cal = Calendar.from_ical(b''.join(response.streaming_content))
         events = [component for component in cal.walk() if component.name == 'VEVENT']
-        self.assertEqual(len(events), 1)
-        
-        # Verify event details
-        event = events[0]
-        self.assertEqual(str(event.get('summary')), self.meeting.title)
-
-
-
-class ICSExportEndpointTestCase(APITestCase):
-    """
-    Test case for ICS export endpoint.
-    
-    Tests Requirement: 4.1
-    """
-    
-    def setUp(self):
-        """Set up test client and sample data."""
-        self.client = APIClient()
-        self.base_url = '/api/meetings/'
-        self.now = timezone.now()
-        
-        # Create test meeting
-        self.meeting = Meeting.objects.create(
-            title='Team Standup',
-            description='Daily standup meeting',
-            start_time=self.now + timedelta(hours=1),
-            end_time=self.now + timedelta(hours=2)
-        )
-        
-        # Add participants
-        Participant.objects.create(
-            meeting=self.meeting,
-            email='alice@example.com',
-            name='Alice Smith'
-        )
-        
-        Participant.objects.create(
-            meeting=self.meeting,
-            email='bob@example.com',
-            name='Bob Johnson'
+        self.assertEqual(len(events), 4)
+        self.assertEqual(
+            {str(event.get('summary')) for event in events},
+            {'Team Standup', self.meeting_special.title, 'Solo Meeting', 'Retro'}
         )
     
-    def test_export_meeting_as_ics(self):
+    def test_export_nonexistent_meeting(self):
         """
-        Test exporting a meeting as ICS file.
+        Test exporting a meeting that doesn't exist.
         Requirement: 4.1
         """
-        response = self.client.get(f'{self.base_url}{self.meeting.id}/export/')
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Verify Content-Type header (may include charset)
-        self.assertIn('text/calendar', response['Content-Type'])
+        fake_uuid = '00000000-0000-0000-0000-000000000000'
+        response = self.client.get(f'{self.base_url}{fake_uuid}/export/')
         
-        # Verify Content-Disposition header
-        self.assertIn('Content-Disposition', response)
-        self.assertIn('attachment', response['Content-Disposition'])
-        self.assertIn('.ics', response['Content-Disposition'])
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn('error', response.data)
     
-    def test_export_ics_content(self):
+    def test_export_revalidates_with_etag(self):
         """
-        Test that exported ICS content is valid.
+        Test that a matching If-None-Match gets 304 until the attendees change.
         Requirement: 4.1
         """
-        response = self.client.get(f'{self.base_url}{self.meeting.id}/export/')
-        
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Get content
-        ics_content = response.content
-        ics_str = ics_content.decode('utf-8')
+        etag = self.client.get(self.export_url)['ETag']
         
-        # Verify ICS structure
-        self.assertIn('BEGIN:VCALENDAR', ics_str)
-        self.assertIn('END:VCALENDAR', ics_str)
-        self.assertIn('BEGIN:VEVENT', ics_str)
-        self.assertIn('END:VEVENT', ics_str)
+        # Only the meeting lookup runs; no ICS is built
+        with self.assertNumQueries(1):
+            response = self.client.get(self.export_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
         
-        # Verify meeting details
-        self.assertIn('SUMMARY:Team Standup', ics_str)
-        self.assertIn('DESCRIPTION:Daily standup meeting', ics_str)
+        self.client.post(
+            f'{self.base_url}{self.meeting.id}/participants/',
+            {'email': 'carol@example.com', 'name': 'Carol'},
+            format='json'
+        )
         
-        # Verify attendees are included
-        self.assertIn('ATTENDEE', ics_str)
+        response = self.client.get(self.export_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
     
-    def test_export_ics_parseable(self):
+    def test_export_nonexistent_meeting_is_remembered(self):
         """
-        Test that exported ICS can be parsed by icalendar library.
+        Test that repeated exports of a missing meeting skip the database.
         Requirement: 4.1
         """
-        from icalendar import Calendar
+        missing_url = f'{self.base_url}{uuid.uuid4()}/export/'
         
-        response = self.client.get(f'{self.base_url}{self.meeting.id}/export/')
+        # The lookup misses, then an unfiltered existence check confirms it
+        with self.assertNumQueries(2):
+            first = self.client.get(missing_url)
+        with self.assertNumQueries(0):
+            second = self.client.get(missing_url)
         
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Parse the ICS content
-        cal = Calendar.from_ical(response.content)
-        
-        # Verify it's a valid calendar
-        self.assertEqual(cal.get('version'), '2.0')
-        
-        # Get events
-        events = [component for component in cal.walk() if component.name == 'VEVENT']
-        self.assertEqual(len(events), 1)
-        
-        # Verify event details
-        event = events[0]
-        self.assertEqual(str(event.get('summary')), self.meeting.title)
-        self.assertEqual(str(event.get('uid')), str(self.meeting.id))
+        self.assertEqual(first.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(second.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(second.data, first.data)
     
-    def test_export_nonexistent_meeting(self):
+    def test_export_filtered_miss_is_not_remembered(self):
         """
-        Test exporting a meeting that doesn't exist.
+        Test that a date filter hiding a meeting does not cache it as missing.
         Requirement: 4.1
         """
-        fake_uuid = '00000000-0000-0000-0000-000000000000'
-        response = self.client.get(f'{self.base_url}{fake_uuid}/export/')
+        filtered = self.client.get(f'{self.export_url}?start_date=2030-01-01T00:00:00Z')
+        response = self.client.get(self.export_url)
         
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
-        self.assertIn('error', response.json())
+        self.assertEqual(filtered.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
     
     def test_export_filename_sanitization(self):
         """
         Test that special characters in meeting title are sanitized in filename.
         Requirement: 4.1
         """
-        meeting_special = Meeting.objects.create(
-            title='Meeting: Q&A / Review (Important!)',
-            description='Special characters test',
-            start_time=self.now + timedelta(hours=3),
-            end_time=self.now + timedelta(hours=4)
-        )
-        
-        response = self.client.get(f'{self.base_url}{meeting_special.id}/export/')
+        with self.assertNumQueries(2):
+            response = self.client.get(f'{self.base_url}{self.meeting_special.id}/export/')
+            b''.join(response.streaming_content)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
@@ -1691,25 +2099,90 @@ class ICSExportEndpointTestCase(APITestCase):
         # Should not contain problematic characters
         self.assertNotIn('/', content_disposition.split('filename=')[1])
         self.assertNotIn(':', content_disposition.split('filename=')[1])
+        self.assertEqual(content_disposition, 'attachment; filename="Meeting_QA__Review_Important.ics"')
     
-    def test_export_meeting_without_participants(self):
+    def test_export_filename_non_ascii_title(self):
         """
-        Test exporting a meeting without participants.
+        Test that non-ASCII titles are sent as a percent-encoded filename*.
         Requirement: 4.1
         """
-        meeting_no_participants = Meeting.objects.create(
-            title='Solo Meeting',
-            description='No participants',
-            start_time=self.now + timedelta(hours=5),
-            end_time=self.now + timedelta(hours=6)
+        meeting = Meeting.objects.create(
+            title='Café Réunion',
+            start_time=self.meeting.start_time,
+            end_time=self.meeting.end_time
         )
         
-        response = self.client.get(f'{self.base_url}{meeting_no_participants.id}/export/')
+        response = self.client.get(f'{self.base_url}{meeting.id}/export/')
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response['Content-Disposition'],
+            "attachment; filename*=utf-8''Caf%C3%A9_R%C3%A9union.ics"
+        )
+    
+    def test_export_meeting_without_participants(self):
+        """
+        Test exporting a meeting without participants.
+        Requirement: 4.1
+        """
+        # One query for the meeting, one (empty) participants query while streaming
+        with self.assertNumQueries(2):
+            response = self.client.get(f'{self.base_url}{self.meeting_solo.id}/export/')
+            ics_content = b''.join(response.streaming_content)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
         self.assertIn('text/calendar', response['Content-Type'])
         
         # Should still be valid ICS
-        ics_str = response.content.decode('utf-8')
-        self.assertIn('BEGIN:VCALENDAR', ics_str)
-        self.assertIn('SUMMARY:Solo Meeting', ics_str)
+        self._assert_valid_ics(ics_content, 'Solo Meeting', self.meeting_solo.id)
+
+
+class ExceptionHandlerTestCase(APITestCase):
+    """
+    Test case for the API exception handler.
+    
+    Tests Requirements: 7.1, 7.5
+    """
+    
+    def test_unexpected_error_gets_generic_500_body(self):
+        """Test that errors DRF does not handle are logged and rendered as a JSON 500."""
+        with self.assertLogs('meeting.exceptions', 'ERROR') as logs:
+            response = exception_handler(RuntimeError('boom'), {})
+        
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(response.data['error'], 'Internal server error')
+        self.assertIn('RuntimeError: boom', logs.output[0])
+    
+    def test_unexpected_error_rolls_back_atomic_request(self):
+        """Test that the generic 500 marks an ATOMIC_REQUESTS transaction for rollback."""
+        with mock.patch.dict(connection.settings_dict, {'ATOMIC_REQUESTS': True}):
+            with transaction.atomic(), self.assertLogs('meeting.exceptions', 'ERROR'):
+                exception_handler(RuntimeError('boom'), {})
+                self.assertTrue(transaction.get_rollback())
+    
+    def test_view_errors_reach_the_handler(self):
+        """Test that unexpected errors raised in meeting views get the generic 500."""
+        with mock.patch.object(
+            ConflictDetector, 'get_conflicts_for_meetings', side_effect=RuntimeError('boom')
+        ), self.assertLogs('meeting.exceptions', 'ERROR'):
+            response = self.client.post(
+                '/api/meetings/check-conflicts-bulk/',
+                {'meeting_ids': [str(uuid.uuid4())]},
+                format='json'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(response.data['error'], 'Internal server error')
+    
+    @override_settings(DEBUG=True)
+    def test_unexpected_error_propagates_in_debug(self):
+        """Test that unexpected errors are left to Django's debug page when DEBUG is on."""
+        self.assertIsNone(exception_handler(RuntimeError('boom'), {}))
+    
+    def test_api_exceptions_keep_drf_rendering(self):
+        """Test that API exceptions are still formatted by DRF."""
+        response = exception_handler(ValidationError({'title': ['Required']}), {})
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'title': ['Required']})
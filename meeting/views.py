@@ -6,16 +6,117 @@ error handling, and proper HTTP status codes.
 
 Requirements: 1.1, 2.1, 2.2, 2.3, 2.4, 5.1, 5.2, 5.3, 5.4, 5.5, 7.1, 7.5
 """
+import re
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from urllib.parse import unquote
+
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError, NotFound
+from rest_framework.renderers import JSONRenderer
+from django.core.cache import cache
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.db import IntegrityError
+from django.db.models import Exists, OuterRef, Q
+from django.http import Http404, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, quote_etag
+from .converters import EmailConverter
 from .models import Meeting, Participant
-from .serializers import MeetingSerializer, ParticipantSerializer
+from .pagination import MeetingCursorPagination
+from .serializers import (
+    BulkConflictCheckSerializer, MeetingReadSerializer, MeetingSerializer, ParticipantSerializer
+)
 from .services import ConflictDetector, ICSGenerator
 
+# Characters kept in download filenames; everything else is dropped in one pass
+_FILENAME_RE = re.compile(r'[^\w.-]+')
+
+# Seconds a meeting id that was not found is remembered by the export actions
+_MISSING_MEETING_TTL = 5
+
+# Most participants accepted by one bulk add request
+_BULK_PARTICIPANTS_MAX = 500
+
+# Streamed lists (?stream=1) read and serialize this many rows at a time
+_LIST_CHUNK_SIZE = 500
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso(value):
+    """
+    Parse an ISO 8601 date or datetime query parameter.
+    
+    A single datetime.fromisoformat call replaces the parse_datetime regex
+    pass plus fallback. Results are memoized because clients polling the
+    same date window send identical strings on every request.
+    
+    Raises:
+        ValueError: If value is not a valid ISO 8601 date or datetime
+    
+    Requirements: 5.5, 6.4 - Date range filtering
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=1024)
+def _filename_stem(title):
+    """
+    Turn a meeting title into a download-safe filename stem.
+    
+    Spaces become underscores and any other character outside [\\w.-] is
+    dropped. Titles rarely change between exports, so results are memoized
+    per title instead of re-sanitizing on every request.
+    
+    Requirement: 4.1
+    """
+    return _FILENAME_RE.sub('', title.replace(' ', '_'))
+
+
+def _meetings_for_participant(email, *conditions, **lookups):
+    """
+    Return the meetings an email participates in, without a join or DISTINCT.
+    
+    An EXISTS subquery per meeting replaces filter(participants__email=...)
+    followed by distinct(), so the database never produces duplicate rows
+    that it then has to sort or hash away. Extra conditions and lookups are
+    applied in the same filter() call rather than cloning the queryset once
+    per filter.
+    
+    Requirements: 6.1, 6.3
+    """
+    return Meeting.objects.filter(
+        Exists(Participant.objects.filter(meeting=OuterRef('pk'), email=email)),
+        *conditions,
+        **lookups
+    )
+
+
+def _format_conflicts(conflicts):
+    """
+    Format a {participant_email: [conflicting meeting dicts]} mapping for a response.
+    
+    Requirement: 3.4
+    """
+    return {
+        email: [
+            {
+                'id': str(m['id']),
+                'title': m['title'],
+                'description': m['description'],
+                'start_time': m['start_time'].isoformat(),
+                'end_time': m['end_time'].isoformat()
+            }
+            for m in conflicting_meetings
+        ]
+        for email, conflicting_meetings in conflicts.items()
+    }
+
 
 class MeetingViewSet(viewsets.ModelViewSet):
     """
@@ -33,6 +134,10 @@ class MeetingViewSet(viewsets.ModelViewSet):
     """
     queryset = Meeting.objects.all().prefetch_related('participants')
     serializer_class = MeetingSerializer
+    pagination_class = MeetingCursorPagination
+    # Meeting ids are UUIDs; anything else fails URL resolution with a 404
+    # before the view runs
+    lookup_value_regex = '[0-9a-fA-F-]{36}'
     
     def get_queryset(self):
         """
@@ -44,11 +149,21 @@ class MeetingViewSet(viewsets.ModelViewSet):
         
         Requirement: 5.5 - Date range filtering
         """
-        from datetime import datetime
-        from django.utils.dateparse import parse_datetime
-        
         queryset = super().get_queryset()
         
+        # Single-meeting exports stream attendees themselves, and retrieve
+        # only reads them once the client's cached copy proves stale; skip
+        # the prefetch for both
+        if self.action in ('export', 'retrieve'):
+            queryset = queryset.prefetch_related(None)
+        # Bulk adds only touch the participant table
+        elif self.action == 'add_participants_bulk':
+            queryset = queryset.prefetch_related(None)
+        # Conflict checks read participant emails with their own query and
+        # only need the meeting's id and time range
+        elif self.action == 'check_conflicts':
+            queryset = queryset.prefetch_related(None).only('id', 'start_time', 'end_time')
+        
         # Get date range parameters
         start_date = self.request.query_params.get('start_date', None)
         end_date = self.request.query_params.get('end_date', None)
@@ -56,16 +171,7 @@ class MeetingViewSet(viewsets.ModelViewSet):
         # Apply filters if provided
         if start_date:
             try:
-                # Try Django's parse_datetime first
-                parsed_start = parse_datetime(start_date)
-                
-                # If that fails, try Python's fromisoformat
-                if parsed_start is None:
-                    parsed_start = datetime.fromisoformat(start_date)
-                
-                if parsed_start is None:
-                    raise ValueError("Could not parse datetime")
-                
+                parsed_start = _parse_iso(start_date)
                 queryset = queryset.filter(start_time__gte=parsed_start)
             except (ValueError, DjangoValidationError, TypeError) as e:
                 raise ValidationError({
@@ -74,13 +180,7 @@ class MeetingViewSet(viewsets.ModelViewSet):
         
         if end_date:
             try:
-                # Try Django's parse_datetime first
-                parsed_end = parse_datetime(end_date)
-                
-                # If that fails, try Python's fromisoformat
-                if parsed_end is None:
-                    parsed_end = datetime.fromisoformat(end_date)
-                
+                parsed_end = _parse_iso(end_date)
                 queryset = queryset.filter(start_time__lte=parsed_end)
             except (ValueError, DjangoValidationError, TypeError) as e:
                 raise ValidationError({
@@ -89,24 +189,70 @@ class MeetingViewSet(viewsets.ModelViewSet):
         
         return queryset
     
+    def get_serializer_class(self):
+        """
+        Use the read-only serializer for list and retrieve.
+        
+        Requirements: 5.3, 5.4
+        """
+        if self.action in ('list', 'retrieve'):
+            return MeetingReadSerializer
+        return super().get_serializer_class()
+    
     def list(self, request, *args, **kwargs):
         """
         List all meetings with optional date range filtering.
         
+        Passing page_size switches to cursor pagination (see
+        MeetingCursorPagination).
+        
+        Clients that pass stream=1 and accept JSON get the unpaginated list
+        streamed as a JSON array, so memory is bounded by the chunk size
+        rather than the number of meetings. The streamed response bypasses
+        the renderer, and its 200 status is sent before the rows are read:
+        an error part-way through ends the body early, leaving invalid JSON
+        that the client must treat as a failed request. Without stream=1 the
+        list is a regular Response.
+        
         Requirements: 5.4, 5.5
         """
-        try:
-            return super().list(request, *args, **kwargs)
-        except ValidationError:
-            raise
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while retrieving meetings'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        queryset = self.filter_queryset(self.get_queryset())
+        
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        
+        if request.query_params.get('stream') == '1' and request.accepted_renderer.format == 'json':
+            return StreamingHttpResponse(
+                self._stream_list(queryset.iterator(chunk_size=_LIST_CHUNK_SIZE)),
+                content_type='application/json'
             )
+        
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+    
+    def _stream_list(self, rows):
+        """
+        Yield a JSON array of serialized meetings, one chunk of rows at a time.
+        
+        Each chunk goes through JSONRenderer, so the output follows the same
+        settings (COMPACT_JSON, STRICT_JSON, U+2028/U+2029 escaping) as a
+        buffered response.
+        
+        Requirement: 5.4
+        """
+        renderer = JSONRenderer()
+        separator = b'['
+        while True:
+            chunk = list(islice(rows, _LIST_CHUNK_SIZE))
+            if not chunk:
+                break
+            # Encode the chunk as an array and drop its brackets
+            data = self.get_serializer(chunk, many=True).data
+            yield separator + renderer.render(data)[1:-1]
+            separator = b','
+        yield b']'
     
     def create(self, request, *args, **kwargs):
         """
@@ -124,8 +270,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_201_CREATED,
                 headers=headers
             )
-        except ValidationError:
-            raise
         except DjangoValidationError as e:
             return Response(
                 {
@@ -134,27 +278,29 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_400_BAD_REQUEST
             )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while creating the meeting'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
     
     def retrieve(self, request, *args, **kwargs):
         """
         Retrieve a specific meeting by ID.
         
+        Clients revalidating with If-None-Match or If-Modified-Since get a
+        304 before participants are loaded or anything is serialized.
+        
         Requirements: 5.1, 7.1
         """
-        from django.http import Http404
-        
         try:
             instance = self.get_object()
+            
+            etag, last_modified = self._meeting_validators(instance)
+            not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if not_modified is not None:
+                return not_modified
+            
             serializer = self.get_serializer(instance)
-            return Response(serializer.data)
+            response = Response(serializer.data)
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            return response
         except Http404:
             return Response(
                 {
@@ -163,14 +309,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while retrieving the meeting'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
     
     def update(self, request, *args, **kwargs):
         """
@@ -178,8 +316,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
         
         Requirements: 5.2, 7.1, 7.5
         """
-        from django.http import Http404
-        
         try:
             partial = kwargs.pop('partial', False)
             instance = self.get_object()
@@ -199,8 +335,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
-        except ValidationError:
-            raise
         except DjangoValidationError as e:
             return Response(
                 {
@@ -209,14 +343,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_400_BAD_REQUEST
             )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while updating the meeting'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
     
     def partial_update(self, request, *args, **kwargs):
         """
@@ -233,8 +359,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
         
         Requirements: 5.3, 7.1
         """
-        from django.http import Http404
-        
         try:
             instance = self.get_object()
             self.perform_destroy(instance)
@@ -247,14 +371,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while deleting the meeting'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
     
     @action(detail=True, methods=['post'], url_path='participants')
     def add_participant(self, request, pk=None):
@@ -271,9 +387,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
         
         Requirements: 2.1, 2.2, 2.4
         """
-        from django.http import Http404
-        from django.db import transaction
-        
         try:
             # Get the meeting
             meeting = self.get_object()
@@ -282,33 +395,36 @@ class MeetingViewSet(viewsets.ModelViewSet):
             serializer = ParticipantSerializer(data=request.data)
             serializer.is_valid(raise_exception=True)
             
-            # Create participant with meeting association
-            # Use atomic block to handle IntegrityError properly
-            try:
-                with transaction.atomic():
-                    participant = Participant.objects.create(
-                        meeting=meeting,
-                        email=serializer.validated_data['email'],
-                        name=serializer.validated_data['name']
-                    )
-                
-                # Return the created participant
-                response_serializer = ParticipantSerializer(participant)
-                return Response(
-                    response_serializer.data,
-                    status=status.HTTP_201_CREATED
-                )
+            # Create participant with meeting association, looking the email
+            # up first so a duplicate is answered without a failed INSERT.
+            # Emails are unique per meeting case-insensitively.
+            email = serializer.validated_data['email']
+            participant, created = Participant.objects.get_or_create(
+                meeting=meeting,
+                email__iexact=email,
+                defaults={'email': email, 'name': serializer.validated_data['name']}
+            )
             
-            except IntegrityError:
-                # Duplicate participant (unique constraint violation)
+            if not created:
+                # Duplicate participant
                 # Requirement: 2.2 - Prevent duplicate participants
                 return Response(
                     {
                         'error': 'Conflict',
-                        'details': f'Participant with email {serializer.validated_data["email"]} is already added to this meeting'
+                        'details': f'Participant with email {email} is already added to this meeting'
                     },
                     status=status.HTTP_409_CONFLICT
                 )
+            
+            # The attendee list is part of the exported ICS
+            meeting.touch()
+            
+            # Return the created participant
+            response_serializer = ParticipantSerializer(participant)
+            return Response(
+                response_serializer.data,
+                status=status.HTTP_201_CREATED
+            )
         
         except Http404:
             return Response(
@@ -318,59 +434,96 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
-        except ValidationError:
-            raise
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while adding the participant'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
     
-    @action(detail=True, methods=['get'], url_path='conflicts')
-    def check_conflicts(self, request, pk=None):
+    @action(detail=True, methods=['post'], url_path='participants/bulk')
+    def add_participants_bulk(self, request, pk=None):
         """
-        Check for scheduling conflicts for all participants in a meeting.
+        Add several participants to a meeting in one request.
         
-        GET /api/meetings/{id}/conflicts/
+        POST /api/meetings/{id}/participants/bulk/
         
-        Returns a list of conflicts for each participant.
+        Request body:
+        {
+            "participants": [
+                {"email": "participant@example.com", "name": "Participant Name"},
+                ...
+            ]
+        }
         
-        This is a test/utility endpoint for verifying conflict detection.
-        Requirements: 3.1, 3.2, 3.4
-        """
-        from django.http import Http404
+        Emails already in the meeting, or repeated within the request, are
+        skipped rather than rejected. New participants are written with a
+        single INSERT; ignore_conflicts covers a concurrent add of the same
+        email, and any row it drops is reported as skipped.
+        
+        Returns:
+        {
+            "created": [participant, ...],
+            "skipped": ["email", ...]
+        }
         
+        Requirements: 2.1, 2.2, 2.4
+        """
         try:
-            # Get the meeting
             meeting = self.get_object()
             
-            # Get all conflicts
-            conflicts = ConflictDetector.get_all_conflicts(meeting)
+            if not isinstance(request.data, dict):
+                raise ValidationError({'participants': ['Expected an object with a "participants" list.']})
             
-            # Format the response
-            response_data = {
-                'meeting_id': str(meeting.id),
-                'meeting_title': meeting.title,
-                'has_conflicts': len(conflicts) > 0,
-                'conflicts': {}
+            serializer = ParticipantSerializer(
+                data=request.data.get('participants', []),
+                many=True,
+                allow_empty=False,
+                max_length=_BULK_PARTICIPANTS_MAX
+            )
+            if not serializer.is_valid():
+                raise ValidationError({'participants': serializer.errors})
+            
+            # Emails are unique per meeting case-insensitively; validated
+            # emails are already lowercased
+            existing = {
+                email.lower()
+                for email in meeting.participants.values_list('email', flat=True)
             }
+            new_participants = []
+            skipped = []
+            for item in serializer.validated_data:
+                email = item['email']
+                if email in existing:
+                    skipped.append(email)
+                    continue
+                existing.add(email)
+                new_participants.append(
+                    Participant(meeting=meeting, email=email, name=item['name'])
+                )
             
-            # Add conflict details for each participant
-            for email, conflicting_meetings in conflicts.items():
-                response_data['conflicts'][email] = [
-                    {
-                        'id': str(m.id),
-                        'title': m.title,
-                        'start_time': m.start_time.isoformat(),
-                        'end_time': m.end_time.isoformat()
-                    }
-                    for m in conflicting_meetings
+            if new_participants:
+                Participant.objects.bulk_create(new_participants, ignore_conflicts=True)
+                
+                # Ids are generated here, so a row exists only if its INSERT
+                # was not dropped because a concurrent request added the email
+                inserted_ids = set(Participant.objects.filter(
+                    id__in=[participant.id for participant in new_participants]
+                ).values_list('id', flat=True))
+                skipped.extend(
+                    participant.email for participant in new_participants
+                    if participant.id not in inserted_ids
+                )
+                new_participants = [
+                    participant for participant in new_participants
+                    if participant.id in inserted_ids
                 ]
+                
+                # The attendee list is part of the exported ICS
+                if new_participants:
+                    meeting.touch()
             
-            return Response(response_data, status=status.HTTP_200_OK)
+            return Response(
+                {
+                    'created': ParticipantSerializer(new_participants, many=True).data,
+                    'skipped': skipped
+                },
+                status=status.HTTP_201_CREATED
+            )
         
         except Http404:
             return Response(
@@ -380,14 +533,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while checking conflicts'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
     
     @action(detail=True, methods=['get'], url_path='check-conflicts')
     def check_conflicts(self, request, pk=None):
@@ -411,34 +556,25 @@ class MeetingViewSet(viewsets.ModelViewSet):
             }
         }
         
+        Query parameters:
+        - detail: Pass 0 to return only {"has_conflicts": true/false}, which
+          stops at the first conflict instead of collecting all of them
+        
         Requirements: 3.1, 3.2, 3.4 (Temporary endpoint for testing)
         """
-        from django.http import Http404
-        
         try:
             # Get the meeting
             meeting = self.get_object()
             
+            if request.query_params.get('detail') == '0':
+                return Response({'has_conflicts': ConflictDetector.has_conflicts(meeting)})
+            
             # Get all conflicts
             conflicts_dict = ConflictDetector.get_all_conflicts(meeting)
             
-            # Format conflicts for response
-            formatted_conflicts = {}
-            for email, conflicting_meetings in conflicts_dict.items():
-                formatted_conflicts[email] = [
-                    {
-                        'id': str(m.id),
-                        'title': m.title,
-                        'description': m.description,
-                        'start_time': m.start_time.isoformat(),
-                        'end_time': m.end_time.isoformat()
-                    }
-                    for m in conflicting_meetings
-                ]
-            
             return Response({
                 'has_conflicts': len(conflicts_dict) > 0,
-                'conflicts': formatted_conflicts
+                'conflicts': _format_conflicts(conflicts_dict)
             })
         
         except Http404:
@@ -449,14 +585,85 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while checking conflicts'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+    
+    @action(detail=False, methods=['post'], url_path='check-conflicts-bulk')
+    def check_conflicts_bulk(self, request):
+        """
+        Check for scheduling conflicts for the participants of several meetings.
+        
+        POST /api/meetings/check-conflicts-bulk/
+        
+        Request body:
+        {
+            "meeting_ids": ["uuid", ...]
+        }
+        
+        Returns a mapping of each meeting ID that exists to the same
+        "conflicts" object check-conflicts returns for it. IDs that do not
+        match a meeting are omitted.
+        
+        Requirements: 3.1, 3.2, 3.4
+        """
+        serializer = BulkConflictCheckSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        meetings = Meeting.objects.filter(
+            id__in=serializer.validated_data['meeting_ids']
+        ).only('id', 'start_time', 'end_time')
+        conflicts = ConflictDetector.get_conflicts_for_meetings(meetings)
+        
+        return Response({
+            str(meeting_id): _format_conflicts(meeting_conflicts)
+            for meeting_id, meeting_conflicts in conflicts.items()
+        })
+    
+    def _get_export_meeting(self):
+        """
+        Return the meeting to export, briefly remembering ids that were not found.
+        
+        Meeting ids are generated server-side, so an id that does not exist
+        will not start existing later. Repeated probes for it (retrying or
+        scanning clients) are answered from the cache without a query.
+        
+        get_object() also applies the start_date/end_date filters, so a miss
+        is only remembered once an unfiltered lookup confirms the id does not
+        exist; otherwise a filtered request would hide an existing meeting.
+        
+        Raises:
+            Http404: If the meeting does not exist or is filtered out
+        
+        Requirement: 4.1
+        """
+        pk = self.kwargs[self.lookup_field]
+        cache_key = f'meeting_missing:{pk}'
+        if cache.get(cache_key):
+            raise Http404
+        
+        try:
+            return self.get_object()
+        except Http404:
+            try:
+                missing = not Meeting.objects.filter(pk=pk).exists()
+            except (ValueError, DjangoValidationError):
+                # Not a valid UUID, so it can never match a meeting
+                missing = True
+            if missing:
+                cache.set(cache_key, True, _MISSING_MEETING_TTL)
+            raise
+    
+    @staticmethod
+    def _meeting_validators(meeting):
+        """
+        Return the (ETag, Last-Modified timestamp) pair for a meeting.
+        
+        Both derive from updated_at, which also moves when participants are
+        added or removed, so they change whenever the meeting's detail
+        representation or exported ICS does.
+        
+        Requirements: 4.1, 5.1
+        """
+        updated_at = meeting.updated_at
+        return quote_etag(f'{meeting.pk}-{updated_at.timestamp()}'), int(updated_at.timestamp())
     
     @action(detail=True, methods=['get'], url_path='export')
     def export(self, request, pk=None):
@@ -469,28 +676,31 @@ class MeetingViewSet(viewsets.ModelViewSet):
         
         Requirement: 4.1 - Export meeting as ICS file
         """
-        from django.http import HttpResponse, Http404
-        
         try:
             # Get the meeting
-            meeting = self.get_object()
+            meeting = self._get_export_meeting()
             
-            # Generate ICS content
-            ics_content = ICSGenerator.generate_ics(meeting)
+            # Let polling calendar clients revalidate without rebuilding the ICS
+            etag, last_modified = self._meeting_validators(meeting)
+            not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if not_modified is not None:
+                return not_modified
             
-            # Create HTTP response with proper headers
-            response = HttpResponse(
-                ics_content,
+            # Stream the ICS content so attendees are written as they are read
+            response = StreamingHttpResponse(
+                ICSGenerator.stream_meeting_ics(meeting),
                 content_type='text/calendar; charset=utf-8'
             )
             
             # Set Content-Disposition header for file download
-            # Use meeting title for filename (sanitize it)
-            filename = f"{meeting.title.replace(' ', '_')}.ics"
-            # Remove any characters that might cause issues in filenames
-            filename = ''.join(c for c in filename if c.isalnum() or c in ('_', '-', '.'))
+            # Use meeting title for filename, dropping characters that might
+            # cause issues in filenames. Non-ASCII titles are sent
+            # percent-encoded as an RFC 6266 filename* parameter.
+            filename = f"{_filename_stem(meeting.title)}.ics"
             
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
+            response['Content-Disposition'] = content_disposition_header(True, filename)
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
             
             return response
         
@@ -502,66 +712,37 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while exporting the meeting'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
     
-    @action(detail=True, methods=['get'], url_path='export')
-    def export_ics(self, request, pk=None):
+    @action(detail=False, methods=['get'], url_path='export')
+    def export_all(self, request):
         """
-        Export meeting as ICS file.
+        Export all meetings as a single ICS (iCalendar) file.
         
-        GET /api/meetings/{id}/export/
+        GET /api/meetings/export/
         
-        Returns an ICS (iCalendar) file that can be imported into calendar applications.
+        Query Parameters:
+            - start_date: Filter meetings starting on or after this date (ISO 8601 format)
+            - end_date: Filter meetings starting on or before this date (ISO 8601 format)
         
-        Requirements: 4.1
+        The calendar is streamed one event at a time so large exports do not
+        have to be held in memory.
+        
+        Requirement: 4.1 - Export meeting as ICS file
         """
-        from django.http import HttpResponse, Http404
+        # Invalid date filters raise ValidationError before streaming starts
+        queryset = self.get_queryset()
         
-        try:
-            # Get the meeting
-            meeting = self.get_object()
-            
-            # Generate ICS content
-            ics_content = ICSGenerator.generate_ics(meeting)
-            
-            # Create HTTP response with proper headers
-            response = HttpResponse(ics_content, content_type='text/calendar')
-            
-            # Set Content-Disposition header for file download
-            # Use meeting title in filename (sanitize for filesystem)
-            safe_title = "".join(c for c in meeting.title if c.isalnum() or c in (' ', '-', '_')).strip()
-            safe_title = safe_title.replace(' ', '_')
-            filename = f"{safe_title}_{meeting.id}.ics"
-            
-            response['Content-Disposition'] = f'attachment; filename="{filename}"'
-            
-            return response
+        response = StreamingHttpResponse(
+            ICSGenerator.stream_ics(queryset),
+            content_type='text/calendar; charset=utf-8'
+        )
+        response['Content-Disposition'] = 'attachment; filename="meetings.ics"'
         
-        except Http404:
-            return Response(
-                {
-                    'error': 'Not found',
-                    'details': 'Meeting with the specified ID does not exist'
-                },
-                status=status.HTTP_404_NOT_FOUND
-            )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while exporting the meeting'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return response
     
-    @action(detail=True, methods=['delete'], url_path='participants/(?P<participant_email>[^/]+)')
+    # Router URLs are regex based, so the email pattern is shared with
+    # EmailConverter rather than applied through it
+    @action(detail=True, methods=['delete'], url_path=f'participants/(?P<participant_email>{EmailConverter.regex})')
     def remove_participant(self, request, pk=None, participant_email=None):
         """
         Remove a participant from a meeting.
@@ -570,9 +751,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
         
         Requirements: 2.3, 2.4
         """
-        from django.http import Http404
-        from urllib.parse import unquote
-        
         try:
             # Get the meeting
             meeting = self.get_object()
@@ -591,11 +769,14 @@ class MeetingViewSet(viewsets.ModelViewSet):
             
             # Find and delete the participant
             try:
+                # Emails are unique per meeting regardless of case
                 participant = Participant.objects.get(
                     meeting=meeting,
-                    email=decoded_email
+                    email__iexact=decoded_email
                 )
                 participant.delete()
+                # The attendee list is part of the exported ICS
+                meeting.touch()
                 
                 return Response(status=status.HTTP_204_NO_CONTENT)
             
@@ -616,14 +797,6 @@ class MeetingViewSet(viewsets.ModelViewSet):
                 },
                 status=status.HTTP_404_NOT_FOUND
             )
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while removing the participant'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
 
 
 
@@ -650,81 +823,50 @@ class ParticipantViewSet(viewsets.ViewSet):
         
         Requirements: 6.1, 6.2, 6.3, 6.4
         """
-        from datetime import datetime
-        from django.utils.dateparse import parse_datetime
-        from urllib.parse import unquote
+        # Collect date range filters if provided
+        # Requirement: 6.4 - Date range filtering
+        start_date = request.query_params.get('start_date', None)
+        end_date = request.query_params.get('end_date', None)
+        conditions = []
         
-        try:
-            # Decode email from URL
-            decoded_email = unquote(email) if email else None
-            
-            if not decoded_email:
+        if start_date:
+            try:
+                parsed_start = _parse_iso(start_date)
+                conditions.append(Q(start_time__gte=parsed_start))
+            except (ValueError, TypeError) as e:
                 return Response(
                     {
                         'error': 'Bad request',
-                        'details': 'Email parameter is required'
+                        'details': 'Invalid start_date format. Please use ISO 8601 format'
                     },
                     status=status.HTTP_400_BAD_REQUEST
                 )
-            
-            # Get all meetings where this participant is involved
-            # Requirement: 6.1 - Return all meetings for participant
-            meetings = Meeting.objects.filter(
-                participants__email=decoded_email
-            ).distinct()
-            
-            # Apply date range filters if provided
-            # Requirement: 6.4 - Date range filtering
-            start_date = request.query_params.get('start_date', None)
-            end_date = request.query_params.get('end_date', None)
-            
-            if start_date:
-                try:
-                    parsed_start = parse_datetime(start_date)
-                    if parsed_start is None:
-                        parsed_start = datetime.fromisoformat(start_date)
-                    meetings = meetings.filter(start_time__gte=parsed_start)
-                except (ValueError, TypeError) as e:
-                    return Response(
-                        {
-                            'error': 'Bad request',
-                            'details': 'Invalid start_date format. Please use ISO 8601 format'
-                        },
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-            
-            if end_date:
-                try:
-                    parsed_end = parse_datetime(end_date)
-                    if parsed_end is None:
-                        parsed_end = datetime.fromisoformat(end_date)
-                    meetings = meetings.filter(start_time__lte=parsed_end)
-                except (ValueError, TypeError) as e:
-                    return Response(
-                        {
-                            'error': 'Bad request',
-                            'details': 'Invalid end_date format. Please use ISO 8601 format'
-                        },
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-            
-            # Order chronologically by start time
-            # Requirement: 6.2 - Chronological ordering
-            meetings = meetings.order_by('start_time')
-            
-            # Serialize the meetings
-            serializer = MeetingSerializer(meetings, many=True)
-            
-            return Response(serializer.data)
         
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while retrieving participant meetings'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        if end_date:
+            try:
+                parsed_end = _parse_iso(end_date)
+                conditions.append(Q(start_time__lte=parsed_end))
+            except (ValueError, TypeError) as e:
+                return Response(
+                    {
+                        'error': 'Bad request',
+                        'details': 'Invalid end_date format. Please use ISO 8601 format'
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+        
+        # Get all meetings where this participant is involved, ordered
+        # chronologically by start time
+        # Requirements: 6.1, 6.2
+        # Prefetch participants so serialization doesn't query per meeting
+        meetings = _meetings_for_participant(email, *conditions).prefetch_related(
+            'participants'
+        ).order_by('start_time')
+        
+        # Serialize the meetings
+        serializer = MeetingReadSerializer(meetings, many=True)
+        
+        return Response(serializer.data)
     
     def conflicts(self, request, email=None):
         """
@@ -740,96 +882,98 @@ class ParticipantViewSet(viewsets.ViewSet):
         
         Requirements: 6.1, 6.2, 6.4
         """
-        from datetime import datetime
-        from django.utils.dateparse import parse_datetime
-        from urllib.parse import unquote
+        # Parse date range filters if provided
+        # Requirement: 6.4 - Date range filtering
+        parsed_start = parsed_end = None
+        start_date = request.query_params.get('start_date', None)
+        end_date = request.query_params.get('end_date', None)
         
-        try:
-            # Decode email from URL
-            decoded_email = unquote(email) if email else None
-            
-            if not decoded_email:
+        if start_date:
+            try:
+                parsed_start = _parse_iso(start_date)
+                if timezone.is_naive(parsed_start):
+                    parsed_start = timezone.make_aware(parsed_start)
+            except (ValueError, TypeError) as e:
                 return Response(
                     {
                         'error': 'Bad request',
-                        'details': 'Email parameter is required'
+                        'details': 'Invalid start_date format. Please use ISO 8601 format'
                     },
                     status=status.HTTP_400_BAD_REQUEST
                 )
-            
-            # Get all meetings where this participant is involved
-            meetings = Meeting.objects.filter(
-                participants__email=decoded_email
-            ).distinct()
-            
-            # Apply date range filters if provided
-            # Requirement: 6.4 - Date range filtering
-            start_date = request.query_params.get('start_date', None)
-            end_date = request.query_params.get('end_date', None)
-            
-            if start_date:
-                try:
-                    parsed_start = parse_datetime(start_date)
-                    if parsed_start is None:
-                        parsed_start = datetime.fromisoformat(start_date)
-                    meetings = meetings.filter(start_time__gte=parsed_start)
-                except (ValueError, TypeError) as e:
-                    return Response(
-                        {
-                            'error': 'Bad request',
-                            'details': 'Invalid start_date format. Please use ISO 8601 format'
-                        },
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-            
-            if end_date:
-                try:
-                    parsed_end = parse_datetime(end_date)
-                    if parsed_end is None:
-                        parsed_end = datetime.fromisoformat(end_date)
-                    meetings = meetings.filter(start_time__lte=parsed_end)
-                except (ValueError, TypeError) as e:
-                    return Response(
-                        {
-                            'error': 'Bad request',
-                            'details': 'Invalid end_date format. Please use ISO 8601 format'
-                        },
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
-            
-            # Order chronologically
-            # Requirement: 6.2 - Chronological ordering
-            meetings = meetings.order_by('start_time')
-            
-            # Find conflicts for each meeting
-            conflicts_list = []
-            
-            for meeting in meetings:
-                # Check if this meeting has conflicts with other meetings for this participant
-                conflicting_meetings = ConflictDetector.check_participant_conflicts(
-                    decoded_email,
-                    meeting,
-                    exclude_meeting_id=meeting.id
+        
+        if end_date:
+            try:
+                parsed_end = _parse_iso(end_date)
+                if timezone.is_naive(parsed_end):
+                    parsed_end = timezone.make_aware(parsed_end)
+            except (ValueError, TypeError) as e:
+                return Response(
+                    {
+                        'error': 'Bad request',
+                        'details': 'Invalid end_date format. Please use ISO 8601 format'
+                    },
+                    status=status.HTTP_400_BAD_REQUEST
                 )
-                
-                if conflicting_meetings.exists():
-                    # This meeting has conflicts
-                    conflicts_list.append({
-                        'meeting': MeetingSerializer(meeting).data,
-                        'conflicting_with': MeetingSerializer(conflicting_meetings, many=True).data
-                    })
-            
+        
+        # Load, in chronological order, only the meetings in the
+        # participant's schedule that overlap another one. Every
+        # conflicting pair is made of two such meetings, so the rest of
+        # the schedule is never read, prefetched or swept.
+        # Requirement: 6.2 - Chronological ordering
+        has_conflict = Exists(
+            _meetings_for_participant(
+                email,
+                start_time__lt=OuterRef('end_time'),
+                end_time__gt=OuterRef('start_time')
+            ).exclude(pk=OuterRef('pk'))
+        )
+        schedule = list(
+            _meetings_for_participant(email, has_conflict).prefetch_related(
+                'participants'
+            ).order_by('start_time')
+        )
+        
+        # Most participants have no conflicting meetings at all; answer
+        # without sweeping or building a serializer
+        if not schedule:
             return Response({
-                'participant_email': decoded_email,
-                'has_conflicts': len(conflicts_list) > 0,
-                'conflicts': conflicts_list
+                'participant_email': email,
+                'has_conflicts': False,
+                'conflicts': []
             })
         
-        except Exception as e:
-            return Response(
-                {
-                    'error': 'Internal server error',
-                    'details': 'An unexpected error occurred while checking participant conflicts'
-                },
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        # Overlaps are found across those meetings in a single sweep;
+        # the date range only limits which meetings are reported
+        overlaps = ConflictDetector.find_overlaps(schedule)
+        
+        reported = [
+            meeting for meeting in schedule
+            if meeting.id in overlaps
+            and (parsed_start is None or meeting.start_time >= parsed_start)
+            and (parsed_end is None or meeting.start_time <= parsed_end)
+        ]
+        
+        # A meeting can appear in several conflicts; serialize each one
+        # involved exactly once, in a single pass, and assemble by id
+        involved = {meeting.id: meeting for meeting in reported}
+        for meeting in reported:
+            for other in overlaps[meeting.id]:
+                involved.setdefault(other.id, other)
+        serialized = dict(zip(
+            involved, MeetingReadSerializer(list(involved.values()), many=True).data
+        ))
+        
+        conflicts_list = [
+            {
+                'meeting': serialized[meeting.id],
+                'conflicting_with': [serialized[other.id] for other in overlaps[meeting.id]]
+            }
+            for meeting in reported
+        ]
+        
+        return Response({
+            'participant_email': email,
+            'has_conflicts': len(conflicts_list) > 0,
+            'conflicts': conflicts_list
+        })
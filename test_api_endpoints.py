@@ -11,25 +11,34 @@ Then in another terminal:
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from urllib.parse import quote
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://localhost:8000/api/meetings/"
 
+# One pooled session so requests reuse keep-alive connections
+SESSION = requests.Session()
+SESSION.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
 def print_response(title, response):
-    """Pretty print API response"""
-    print(f"\n{'='*60}")
-    print(f"{title}")
-    print(f"{'='*60}")
-    print(f"Status Code: {response.status_code}")
+    """Pretty print API response in a single write, so concurrent tests don't interleave"""
+    lines = [
+        f"\n{'='*60}",
+        f"{title}",
+        f"{'='*60}",
+        f"Status Code: {response.status_code}",
+    ]
     if response.text:
         try:
-            print(f"Response:\n{json.dumps(response.json(), indent=2)}")
+            lines.append(f"Response:\n{json.dumps(response.json(), indent=2)}")
         except:
-            print(f"Response: {response.text}")
+            lines.append(f"Response: {response.text}")
     else:
-        print("Response: (empty)")
-    print(f"{'='*60}\n")
+        lines.append("Response: (empty)")
+    lines.append(f"{'='*60}\n")
+    print("\n".join(lines))
 
 def test_create_meeting():
     """Test: Create a new meeting"""
@@ -40,7 +49,7 @@ def test_create_meeting():
         "end_time": "2025-12-15T11:00:00+00:00"
     }
     
-    response = requests.post(BASE_URL, json=meeting_data)
+    response = SESSION.post(BASE_URL, json=meeting_data)
     print_response("1. CREATE MEETING (POST /api/meetings/)", response)
     
     if response.status_code == 201:
@@ -49,7 +58,7 @@ def test_create_meeting():
 
 def test_list_meetings():
     """Test: List all meetings"""
-    response = requests.get(BASE_URL)
+    response = SESSION.get(BASE_URL)
     print_response("2. LIST ALL MEETINGS (GET /api/meetings/)", response)
 
 def test_list_with_filter():
@@ -57,13 +66,12 @@ def test_list_with_filter():
     start_date = "2025-12-01T00:00:00+00:00"
     end_date = "2025-12-31T23:59:59+00:00"
     
-    url = f"{BASE_URL}?start_date={quote(start_date)}&end_date={quote(end_date)}"
-    response = requests.get(url)
+    response = SESSION.get(BASE_URL, params={"start_date": start_date, "end_date": end_date})
     print_response("3. LIST WITH DATE FILTER (GET /api/meetings/?start_date=...&end_date=...)", response)
 
 def test_retrieve_meeting(meeting_id):
     """Test: Retrieve a specific meeting"""
-    response = requests.get(f"{BASE_URL}{meeting_id}/")
+    response = SESSION.get(f"{BASE_URL}{meeting_id}/")
     print_response(f"4. RETRIEVE MEETING (GET /api/meetings/{meeting_id}/)", response)
 
 def test_update_meeting(meeting_id):
@@ -75,7 +83,7 @@ def test_update_meeting(meeting_id):
         "end_time": "2025-12-15T12:00:00+00:00"
     }
     
-    response = requests.put(f"{BASE_URL}{meeting_id}/", json=update_data)
+    response = SESSION.put(f"{BASE_URL}{meeting_id}/", json=update_data)
     print_response(f"5. UPDATE MEETING (PUT /api/meetings/{meeting_id}/)", response)
 
 def test_partial_update_meeting(meeting_id):
@@ -84,7 +92,7 @@ def test_partial_update_meeting(meeting_id):
         "title": "Quick Sprint Planning"
     }
     
-    response = requests.patch(f"{BASE_URL}{meeting_id}/", json=patch_data)
+    response = SESSION.patch(f"{BASE_URL}{meeting_id}/", json=patch_data)
     print_response(f"6. PARTIAL UPDATE (PATCH /api/meetings/{meeting_id}/)", response)
 
 def test_add_participant(meeting_id):
@@ -94,7 +102,7 @@ def test_add_participant(meeting_id):
         "name": "John Doe"
     }
     
-    response = requests.post(f"{BASE_URL}{meeting_id}/participants/", json=participant_data)
+    response = SESSION.post(f"{BASE_URL}{meeting_id}/participants/", json=participant_data)
     print_response(f"7. ADD PARTICIPANT (POST /api/meetings/{meeting_id}/participants/)", response)
     return response.status_code == 201
 
@@ -105,18 +113,18 @@ def test_add_duplicate_participant(meeting_id):
         "name": "John Doe"
     }
     
-    response = requests.post(f"{BASE_URL}{meeting_id}/participants/", json=participant_data)
+    response = SESSION.post(f"{BASE_URL}{meeting_id}/participants/", json=participant_data)
     print_response(f"8. ADD DUPLICATE PARTICIPANT (POST /api/meetings/{meeting_id}/participants/)", response)
 
 def test_remove_participant(meeting_id):
     """Test: Remove a participant from a meeting"""
     email = "john.doe@example.com"
-    response = requests.delete(f"{BASE_URL}{meeting_id}/participants/{quote(email)}/")
+    response = SESSION.delete(f"{BASE_URL}{meeting_id}/participants/{quote(email, safe='')}/")
     print_response(f"9. REMOVE PARTICIPANT (DELETE /api/meetings/{meeting_id}/participants/{email}/)", response)
 
 def test_export_meeting(meeting_id):
     """Test: Export meeting as ICS file"""
-    response = requests.get(f"{BASE_URL}{meeting_id}/export/")
+    response = SESSION.get(f"{BASE_URL}{meeting_id}/export/")
     print_response(f"10. EXPORT MEETING AS ICS (GET /api/meetings/{meeting_id}/export/)", response)
     
     if response.status_code == 200:
@@ -127,7 +135,7 @@ def test_export_meeting(meeting_id):
 
 def test_delete_meeting(meeting_id):
     """Test: Delete a meeting"""
-    response = requests.delete(f"{BASE_URL}{meeting_id}/")
+    response = SESSION.delete(f"{BASE_URL}{meeting_id}/")
     print_response(f"11. DELETE MEETING (DELETE /api/meetings/{meeting_id}/)", response)
 
 def test_error_scenarios():
@@ -143,7 +151,7 @@ def test_error_scenarios():
         "start_time": "2025-12-05T10:00:00+00:00",
         "end_time": "2025-12-05T09:00:00+00:00"
     }
-    response = requests.post(BASE_URL, json=invalid_data)
+    response = SESSION.post(BASE_URL, json=invalid_data)
     print_response("ERROR: Invalid Time Range", response)
     
     # Test 2: Missing required fields
@@ -151,18 +159,18 @@ def test_error_scenarios():
     incomplete_data = {
         "description": "Only description provided"
     }
-    response = requests.post(BASE_URL, json=incomplete_data)
+    response = SESSION.post(BASE_URL, json=incomplete_data)
     print_response("ERROR: Missing Required Fields", response)
     
     # Test 3: Non-existent meeting
     print("\n--- Test: Retrieve Non-existent Meeting ---")
     fake_id = "00000000-0000-0000-0000-000000000000"
-    response = requests.get(f"{BASE_URL}{fake_id}/")
+    response = SESSION.get(f"{BASE_URL}{fake_id}/")
     print_response("ERROR: Meeting Not Found", response)
     
     # Test 4: Invalid date format in filter
     print("\n--- Test: Invalid Date Format in Filter ---")
-    response = requests.get(f"{BASE_URL}?start_date=invalid-date")
+    response = SESSION.get(BASE_URL, params={"start_date": "invalid-date"})
     print_response("ERROR: Invalid Date Format", response)
 
 def main():
@@ -178,9 +186,15 @@ def main():
         meeting_id = test_create_meeting()
         
         if meeting_id:
-            test_list_meetings()
-            test_list_with_filter()
-            test_retrieve_meeting(meeting_id)
+            # Read-only checks are independent of each other; run them concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [
+                    executor.submit(test_list_meetings),
+                    executor.submit(test_list_with_filter),
+                    executor.submit(test_retrieve_meeting, meeting_id),
+                ]
+                for future in futures:
+                    future.result()
             test_update_meeting(meeting_id)
             test_partial_update_meeting(meeting_id)
             